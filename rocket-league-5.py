@@ -15,13 +15,26 @@ import random
 import numpy as np
 import sys
 import time
+from bisect import bisect_right
+from collections import deque
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import accumulate
 from typing import List, Tuple, Optional
 from enum import Enum
 
+try:
+    from numba import njit
+except ImportError:  # Numba is optional — kernels then run as plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]): return args[0]
+        return lambda f: f
+
 # ─── CONFIG ───────────────────────────────────────────────────────────────────
 SCREEN_W, SCREEN_H = 1280, 720
+CX, CY = SCREEN_W // 2, SCREEN_H // 2   # screen centre
 FPS = 60
+MENU_FPS = 30   # frame cap outside live play (menus, goal flash, gameover)
 BALL_RADIUS = 16
 CAR_W, CAR_H = 36, 22
 GOAL_W, GOAL_H = 22, 150
@@ -30,6 +43,8 @@ BOOST_RECHARGE = 8.0
 BOOST_COST = 30.0
 BOOST_SPEED = 520.0
 MAX_SPEED = 380.0
+PHYS_DT = 1.0 / 60   # fixed physics step, independent of the render rate
+MAX_PARTICLES = 4096   # particle pool size preallocated at startup
 
 # ─── LEVEL DEFINITIONS ───────────────────────────────────────────────────────
 LEVELS = [
@@ -109,60 +124,312 @@ LEVELS = [
         "description": "Pulse rings · Lightning nodes · Neon grid",
     },
 ]
+N_LEVELS = len(LEVELS)
 
 # ─── MATH HELPERS ─────────────────────────────────────────────────────────────
-def v2_len(v):     return math.sqrt(v[0]**2 + v[1]**2)
-def v2_norm(v):
-    l = v2_len(v)
-    return (v[0]/l, v[1]/l) if l > 0.001 else (0, 0)
+TAU = math.pi * 2
+v2_len = math.hypot   # v2_len(x, y) — no tuple packing on the Python side
+@njit(cache=True, inline='always')
+def v2_len_nb(x, y): return math.sqrt(x * x + y * y)   # for use inside @njit kernels
 def lerp(a, b, t): return a + (b - a) * t
 def clamp(v, lo, hi): return max(lo, min(hi, v))
 
+BOLT_ANGLES = [i * TAU / 5 for i in range(5)]   # lightning bolt spokes
+HEX_OFFSETS = np.array([(math.cos(math.radians(a)), math.sin(math.radians(a)))
+                        for a in range(0, 360, 60)])
+
+
+
+# ─── PHYSICS KERNELS ──────────────────────────────────────────────────────────
+@njit(cache=True, fastmath=True)
+def _apply_gravity_batch(pos, vel, mass, grav, neb, gc_xy, gc_half, gc_push, dt):
+    """Anomaly and corridor forces for every row of pos/vel, vel updated in place."""
+    drag = math.exp(-0.35 * dt)
+    for k in range(pos.shape[0]):
+        ox = pos[k, 0]; oy = pos[k, 1]
+        vx = vel[k, 0]; vy = vel[k, 1]
+        inv_m = dt / mass[k]
+        # Black holes and repulsors: strength / dist**1.2 within 3 radii
+        for i in range(grav.shape[0]):
+            dx = grav[i, 0] - ox; dy = grav[i, 1] - oy
+            d2 = max(1.0, dx * dx + dy * dy)
+            r = grav[i, 2]
+            # strength / dist**1.2 along the unit normal dx / dist == dx * d2**-1.1
+            force = grav[i, 3] * d2**-1.1 * inv_m * (d2 < 9 * r * r)
+            vx += dx * force; vy += dy * force
+        # Nebula zones: velocity drag while inside
+        for i in range(neb.shape[0]):
+            dx = neb[i, 0] - ox; dy = neb[i, 1] - oy
+            r = neb[i, 2]
+            if max(1.0, dx * dx + dy * dy) < r * r:
+                vx *= drag; vy *= drag
+        # Gravity corridors: constant push inside each rectangle
+        for i in range(gc_xy.shape[0]):
+            if abs(ox - gc_xy[i, 0]) < gc_half[i, 0] and abs(oy - gc_xy[i, 1]) < gc_half[i, 1]:
+                vx += gc_push[i, 0] * inv_m; vy += gc_push[i, 1] * inv_m
+        vel[k, 0] = vx; vel[k, 1] = vy
+
+@njit("b1(f8, f8, f8, f8[:], f8[:], f8[:], b1[:], f8[:], f8[:], f8[:])",
+      cache=True, fastmath=True)
+def _hazard_hit(ox, oy, radius, ln_x, ln_y, ln_r, ln_active, pr_cx, pr_cy, pr_radius):
+    # Lightning nodes
+    for i in range(ln_x.shape[0]):
+        if ln_active[i]:
+            dx = ox - ln_x[i]; dy = oy - ln_y[i]
+            thr = ln_r[i] + radius
+            if dx * dx + dy * dy < thr * thr:
+                return True
+    # Pulse rings (thin ring collision): |d - R| < w  <=>  (R - w)^2 < d^2 < (R + w)^2
+    w = 10 + radius
+    for i in range(pr_cx.shape[0]):
+        dx = ox - pr_cx[i]; dy = oy - pr_cy[i]
+        d2 = dx * dx + dy * dy
+        inner = pr_radius[i] - w; outer = pr_radius[i] + w
+        if d2 < outer * outer and (inner < 0 or d2 > inner * inner):
+            return True
+    return False
+
+@njit("Tuple((f8, f8, f8, f8, b1))(f8, f8, f8, f8, b1, b1, b1, b1, b1, f8)",
+      cache=True, fastmath=True)
+def _drive(vx, vy, angle, boost, left, right, forward, back, boost_key, dt):
+    """Car steering, thrust, boost and drag -> (vx, vy, angle, boost, boosting)."""
+    rot = 220 * dt * (math.pi / 180)
+    if left:  angle -= rot
+    if right: angle += rot
+    c = math.cos(angle); s = math.sin(angle)
+    if forward: vx += c * 400 * dt; vy += s * 400 * dt
+    if back:    vx -= c * 200 * dt; vy -= s * 200 * dt
+    boosting = boost_key and boost > 5 and forward
+    if boosting:
+        vx += c * BOOST_SPEED * dt; vy += s * BOOST_SPEED * dt
+        boost -= BOOST_COST * dt
+    else:
+        boost = min(BOOST_MAX, boost + BOOST_RECHARGE * dt)
+    spd2 = vx * vx + vy * vy
+    max_s = BOOST_SPEED if boosting else MAX_SPEED
+    if spd2 > max_s * max_s:
+        scale = max_s / math.sqrt(spd2)
+        vx *= scale; vy *= scale
+    drag = 0.999 if forward or back else 0.992
+    return vx * drag, vy * drag, angle, boost, boosting
+
+@njit("UniTuple(f8, 4)(f8, f8, f8, f8, f8, f8)", cache=True, fastmath=True)
+def _wall_bounce(x, y, vx, vy, margin, keep):
+    """Clamp to the arena inset by margin, reflecting velocity away at `keep` speed."""
+    nx = min(max(x, margin), SCREEN_W - margin)
+    if nx != x: vx = math.copysign(abs(vx) * keep, nx - x); x = nx
+    ny = min(max(y, margin), SCREEN_H - margin)
+    if ny != y: vy = math.copysign(abs(vy) * keep, ny - y); y = ny
+    return x, y, vx, vy
+
+@njit("Tuple((b1, f8, f8, f8, f8, f8, f8))(f8, f8, f8, f8, f8, f8, f8, f8, b1)",
+      cache=True, fastmath=True)
+def _ball_car_hit(bx, by, bvx, bvy, cx, cy, cvx, cvy, boosting):
+    """Ball/car contact -> (hit, bx, by, bvx, bvy, cvx, cvy)."""
+    dx = bx - cx; dy = by - cy
+    d2 = dx * dx + dy * dy
+    min_d = BALL_RADIUS + max(CAR_W, CAR_H) // 2
+    if d2 < min_d * min_d and d2 > 0.01:
+        d = math.sqrt(d2)
+        nx = dx / d; ny = dy / d
+        impact = max(v2_len_nb(cvx, cvy) * 0.8, 260) + (200 if boosting else 0)
+        bvx = nx * impact + cvx * 0.3; bvy = ny * impact + cvy * 0.3
+        cvx -= nx * 80; cvy -= ny * 80
+        bx = cx + nx * (min_d + 2); by = cy + ny * (min_d + 2)
+        return True, bx, by, bvx, bvy, cvx, cvy
+    return False, bx, by, bvx, bvy, cvx, cvy
+
+@njit("Tuple((b1, b1, f8))(f8, f8, f8, f8, f8)", cache=True, fastmath=True)
+def _steer(tx, ty, cx, cy, angle):
+    """Turn direction toward (tx, ty) -> (left, right, squared distance)."""
+    dx = tx - cx; dy = ty - cy
+    ad = (math.atan2(dy, dx) - angle + math.pi) % (2 * math.pi) - math.pi
+    return ad < -0.08, ad > 0.08, dx * dx + dy * dy
+
+@njit("void(f8[:], b1[:], f8)", cache=True)
+def _update_lightning(timer, active, dt):
+    for i in range(timer.shape[0]):
+        timer[i] -= dt
+        if timer[i] <= 0:
+            active[i] = not active[i]
+            timer[i] = np.random.uniform(0.4, 2.5) if active[i] else np.random.uniform(1.0, 4.0)
+
+
+# ─── RASTER HELPERS ───────────────────────────────────────────────────────────
+@lru_cache(maxsize=None)
+def disk_offsets(r: int):
+    """Pixel offsets (dx, dy) that pygame.draw.circle fills for radius r."""
+    c = r + 1
+    s = pygame.Surface((2 * c, 2 * c))
+    pygame.draw.circle(s, (255, 255, 255), (c, c), r)
+    xs, ys = np.nonzero(pygame.surfarray.array2d(s))
+    return (xs - c).astype(np.int32), (ys - c).astype(np.int32)
+
+def splat(pixels, alpha, xi, yi, radii, cols):
+    """Stamp filled discs into surfarray views in one vector store per radius."""
+    w, h = pixels.shape[:2]
+    for r in np.unique(radii).tolist():
+        sel = radii == r
+        ox, oy = disk_offsets(r)
+        px = (xi[sel, None] + ox).ravel()
+        py = (yi[sel, None] + oy).ravel()
+        c = np.repeat(cols[sel], len(ox), axis=0)
+        ok = (px >= 0) & (px < w) & (py >= 0) & (py < h)
+        px, py = px[ok], py[ok]
+        pixels[px, py] = c[ok]
+        if alpha is not None: alpha[px, py] = 255
+
+@lru_cache(maxsize=256)
+def alpha_disk(r: int, rgba):
+    """A (2r, 2r) SRCALPHA sprite holding one filled translucent circle."""
+    s = pygame.Surface((r * 2, r * 2), pygame.SRCALPHA)
+    pygame.draw.circle(s, rgba, (r, r), r)
+    return s.convert_alpha()
+
+@lru_cache(maxsize=64)
+def trail_sprites(rgb, n: int, tint, r_max: float):
+    """Opaque disc sprites for an n-long trail, fading from tail to head.
+
+    Segment i has colour rgb * tint * i/n and radius max(1, r_max * i/n),
+    matching the old per-segment pygame.draw.circle calls. Returns a list of
+    (sprite, radius) pairs; blit sprite i at (x - radius, y - radius).
+    """
+    out = []
+    for i in range(n):
+        alpha = i / max(1, n)
+        col = tuple(int(c * alpha * k) for c, k in zip(rgb, tint))
+        r = max(1, int(r_max * alpha))
+        out.append((alpha_disk(r, col + (255,)), r))
+    return out
 
-# ─── PARTICLE SYSTEM ──────────────────────────────────────────────────────────
-@dataclass
-class Particle:
-    x: float; y: float
-    vx: float; vy: float
-    life: float; max_life: float
-    color: tuple; size: float
-    fade: bool = True
 
+# ─── PARTICLE SYSTEM ──────────────────────────────────────────────────────────
 class ParticleSystem:
-    def __init__(self):
-        self.particles: List[Particle] = []
+    """Particles live in fixed-capacity float32 columns with an alive bitmap.
+
+    Free slots are kept on an index stack: emits pop from it and update
+    pushes back the slots whose life ran out, so nothing is scanned,
+    compacted or allocated per frame. `hw` is one past the highest slot in
+    use and bounds all per-frame array work.
+    """
+    FIELDS = ("x", "y", "vx", "vy", "life", "max_life", "size", "fade")
+    LOG_DAMP = math.log(0.97) * 60.0   # 0.97 per 1/60 s frame, as a rate
+    SPLAT_MAX_R = 3   # larger discs fall back to pygame.draw.circle
+
+    def __init__(self, capacity=MAX_PARTICLES):
+        self.arrays = {k: np.zeros(capacity, dtype=np.float32) for k in self.FIELDS}
+        self.col = np.zeros((capacity, 3), dtype=np.uint8)
+        self.alive = np.zeros(capacity, dtype=np.bool_)
+        # Lowest indices on top so live particles stay packed under hw
+        self._free = np.arange(capacity - 1, -1, -1, dtype=np.intp)
+        self._nfree = capacity
+        self.hw = 0
+        self._rng = np.random.default_rng()
+        self._pending = []   # queue() requests awaiting the next update
+
+    def _grow(self, need):
+        cap = old = len(self.alive)
+        while cap < need: cap *= 2
+        for k, arr in self.arrays.items():
+            self.arrays[k] = np.resize(arr, cap)
+        self.col = np.resize(self.col, (cap, 3))
+        self.alive = np.concatenate([self.alive, np.zeros(cap - old, np.bool_)])
+        # New slots go underneath the existing free ones
+        free = np.empty(cap, dtype=np.intp)
+        free[:cap - old] = np.arange(cap - 1, old - 1, -1)
+        free[cap - old:cap - old + self._nfree] = self._free[:self._nfree]
+        self._free = free
+        self._nfree += cap - old
+
+    def _free_slots(self, count):
+        if count > self._nfree:
+            self._grow(len(self.alive) + count - self._nfree)
+        self._nfree -= count
+        return self._free[self._nfree:self._nfree + count]
+
+    def _write(self, idx, x, y, vx, vy, life, size, fade, rgb):
+        if not len(idx): return   # count=0 emits spawn nothing
+        a = self.arrays
+        a["x"][idx] = x;             a["y"][idx] = y
+        a["vx"][idx] = vx;           a["vy"][idx] = vy
+        a["life"][idx] = life;       a["max_life"][idx] = life
+        a["size"][idx] = size;       a["fade"][idx] = fade
+        self.col[idx] = rgb
+        self.alive[idx] = True
+        self.hw = max(self.hw, int(idx.max()) + 1)
 
     def emit(self, x, y, vx, vy, color, count=1, spread=2.0, life=0.8, size=3.0, fade=True):
-        for _ in range(count):
-            angle = random.uniform(0, math.pi * 2)
-            spd = random.uniform(0, spread)
-            self.particles.append(Particle(
-                x, y,
-                vx + math.cos(angle) * spd,
-                vy + math.sin(angle) * spd,
-                life, life, color, size, fade
-            ))
+        idx = self._free_slots(count)
+        angle = self._rng.uniform(0, TAU, size=count)
+        spd = self._rng.uniform(0, spread, size=count)
+        self._write(idx, x, y, vx + np.cos(angle) * spd, vy + np.sin(angle) * spd,
+                    life, size, fade, color[:3])
+
+    def emit_batch(self, x, y, color, count, spread, life_range, size_range,
+                   vx=0.0, vy=0.0, fade=True):
+        """Burst of `count` particles with per-particle life and size, all
+        drawn from one (count, 4) uniform sample."""
+        u = self._rng.random((count, 4), dtype=np.float32)
+        (l0, l1), (s0, s1) = life_range, size_range
+        angle = u[:, 0] * TAU; spd = u[:, 1] * spread
+        self._write(self._free_slots(count), x, y,
+                    vx + np.cos(angle) * spd, vy + np.sin(angle) * spd,
+                    l0 + u[:, 3] * (l1 - l0), s0 + u[:, 2] * (s1 - s0), fade, color[:3])
+
+    def queue(self, x, y, vx, vy, color, count=1, spread=2.0, life=0.8, size=3.0, fade=True):
+        """Deferred emit: queued requests are spawned together at the next update."""
+        self._pending.append((x, y, vx, vy, *color[:3], count, spread, life, size, fade))
+
+    def _flush(self):
+        rows = np.array(self._pending, dtype=np.float32)
+        self._pending.clear()
+        rows = np.repeat(rows, rows[:, 7].astype(np.intp), axis=0)
+        x, y, vx, vy, _, _, _, _, spread, life, size, fade = rows.T
+        u = self._rng.random((len(rows), 2), dtype=np.float32)
+        angle = u[:, 0] * TAU; spd = u[:, 1] * spread
+        self._write(self._free_slots(len(rows)), x, y,
+                    vx + np.cos(angle) * spd, vy + np.sin(angle) * spd,
+                    life, size, fade, rows[:, 4:7])
 
     def update(self, dt):
-        alive = []
-        for p in self.particles:
-            p.x += p.vx * dt
-            p.y += p.vy * dt
-            p.vx *= 0.97
-            p.vy *= 0.97
-            p.life -= dt
-            if p.life > 0:
-                alive.append(p)
-        self.particles = alive
+        if self._pending: self._flush()
+        n = self.hw
+        if not n: return
+        # Dead slots below hw are integrated too; it is cheaper than gathering
+        a = self.arrays
+        x, y, vx, vy, life = (a[k][:n] for k in ("x", "y", "vx", "vy", "life"))
+        x += vx * dt;  y += vy * dt
+        damp = math.exp(self.LOG_DAMP * dt)
+        vx *= damp; vy *= damp
+        life -= dt
+        live = self.alive[:n]
+        dead = np.flatnonzero(live & (life <= 0))
+        if dead.size:
+            live[dead] = False
+            self._free[self._nfree:self._nfree + dead.size] = dead[::-1]
+            self._nfree += dead.size
+        nz = np.flatnonzero(live)
+        self.hw = int(nz[-1]) + 1 if nz.size else 0
 
     def draw(self, surf):
-        for p in self.particles:
-            alpha = p.life / p.max_life if p.fade else 1.0
-            r = int(p.color[0] * alpha)
-            g = int(p.color[1] * alpha)
-            b = int(p.color[2] * alpha)
-            sz = max(1, int(p.size * alpha))
-            pygame.draw.circle(surf, (r, g, b), (int(p.x), int(p.y)), sz)
+        idx = np.flatnonzero(self.alive[:self.hw])
+        if not idx.size: return
+        a = self.arrays
+        alpha = np.where(a["fade"][idx] > 0, a["life"][idx] / a["max_life"][idx], 1.0)
+        cols = (self.col[idx] * alpha[:, None]).astype(np.uint8)
+        sz = np.maximum(1, (a["size"][idx] * alpha).astype(np.int32))
+        xi = a["x"][idx].astype(np.int32); yi = a["y"][idx].astype(np.int32)
+
+        # Every disc is opaque, so small ones are stamped straight into the
+        # target's pixels and only the few large ones go through draw.circle
+        small = sz <= self.SPLAT_MAX_R
+        rgb = pygame.surfarray.pixels3d(surf)
+        splat(rgb, None, xi[small], yi[small], sz[small], cols[small])
+        del rgb
+        big = np.flatnonzero(~small)
+        for px, py, col, r in zip(xi[big].tolist(), yi[big].tolist(),
+                                  cols[big].tolist(), sz[big].tolist()):
+            pygame.draw.circle(surf, col, (px, py), r)
 
 
 # ─── HAZARDS ──────────────────────────────────────────────────────────────────
@@ -173,14 +440,13 @@ class CrystalShard:
 @dataclass
 class GravityCorridor:
     x: float; y: float; width: float; height: float; strength: float; direction: float
+    # (fill, outline, topleft): fill sprite at full alpha, faded per frame with set_alpha
+    cached_surf: Optional[tuple] = field(default=None, repr=False)
 
-@dataclass
-class PulseRing:
-    cx: float; cy: float; radius: float; max_radius: float; speed: float; color: tuple
-
-@dataclass
-class LightningNode:
-    x: float; y: float; timer: float; active: bool; radius: float
+    def __post_init__(self):
+        # direction and size never change; keep the trig and half-extents around
+        self.cos_d = math.cos(self.direction); self.sin_d = math.sin(self.direction)
+        self.hw = self.width / 2;              self.hh = self.height / 2
 
 
 # ─── TERRAIN LAYER ─────────────────────────────────────────────────────────────
@@ -190,22 +456,40 @@ class TerrainRenderer:
     def __init__(self, level_id: int, rng: random.Random):
         self.level_id = level_id
         self.rng = rng
+        self._scratch = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA).convert_alpha()
         self._bake(level_id, rng)
+        # draw_dynamic(surf, t) is bound straight to the level's animated layers
+        self.draw_dynamic = (self._draw_lunar, self._draw_nebula, self._draw_asteroid_graveyard,
+                             self._draw_black_hole_station, self._draw_pulsar_core)[level_id]
 
     def _bake(self, lid, rng):
         """Pre-generate all terrain geometry."""
         self.elements = []  # (kind, data)
-
-        if lid == 0:  # LUNAR COLOSSEUM
-            self._bake_lunar(rng)
-        elif lid == 1:  # NEBULA RIFT
-            self._bake_nebula(rng)
-        elif lid == 2:  # ASTEROID GRAVEYARD
-            self._bake_asteroid_graveyard(rng)
-        elif lid == 3:  # BLACK HOLE STATION
-            self._bake_black_hole_station(rng)
-        elif lid == 4:  # PULSAR CORE
-            self._bake_pulsar_core(rng)
+        (self._bake_lunar,                # LUNAR COLOSSEUM
+         self._bake_nebula,               # NEBULA RIFT
+         self._bake_asteroid_graveyard,   # ASTEROID GRAVEYARD
+         self._bake_black_hole_station,   # BLACK HOLE STATION
+         self._bake_pulsar_core,          # PULSAR CORE
+         )[lid](rng)
+
+    def _clear_scratch(self):
+        """The shared full-screen SRCALPHA layer, cleared for the next overlay."""
+        self._scratch.fill((0, 0, 0, 0))
+        return self._scratch
+
+    def _new_static_surf(self):
+        """Opaque level-background surface that the static layers are baked into."""
+        s = pygame.Surface((SCREEN_W, SCREEN_H)).convert()
+        s.fill(LEVELS[self.level_id]["bg"])
+        return s
+
+    def _star_brightness(self):
+        return np.array([st[2] for st in self.stars], dtype=np.int32)
+
+    def _bake_stars(self, surf, cols):
+        """Draw self.stars with a precomputed (N, 3) colour array."""
+        for (sx, sy, _, ss), col in zip(self.stars, map(tuple, cols.tolist())):
+            pygame.draw.circle(surf, col, (sx, sy), ss)
 
     def _bake_lunar(self, rng):
         # Stars — cold white/blue
@@ -239,9 +523,32 @@ class TerrainRenderer:
             self.ridges.append(pts)
         # Arena rings (decorative) — big circles
         self.arena_rings = [
-            (SCREEN_W // 2, SCREEN_H // 2, 260),
-            (SCREEN_W // 2, SCREEN_H // 2, 320),
+            (CX, CY, 260),
+            (CX, CY, 320),
         ]
+        self.arena_ring_texs = []
+        for cx, cy, cr in self.arena_rings:
+            a = pygame.Surface((cr * 2 + 4, cr * 2 + 4), pygame.SRCALPHA)
+            pygame.draw.circle(a, (140, 160, 255), (cr + 2, cr + 2), cr, 2)
+            self.arena_ring_texs.append(a.convert_alpha())
+
+        # Static layer — everything except the pulsing arena rings
+        self.static_surf = surf = self._new_static_surf()
+        sb = self._star_brightness()
+        self._bake_stars(surf, np.stack([sb, sb, np.minimum(255, sb + 30)], axis=1))
+        ds = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
+        for px, py, pw, ph in self.dust_patches:
+            pygame.draw.ellipse(ds, (180, 190, 220, 22), (px - pw, py - ph, pw * 2, ph * 2))
+        surf.blit(ds, (0, 0))
+        for pts in self.ridges:
+            pygame.draw.polygon(surf, (28, 32, 52), pts)
+            pygame.draw.lines(surf, (60, 70, 110), False, pts[:-2], 2)
+        cs = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
+        for cx, cy, cr in self.craters:
+            pygame.draw.circle(cs, (100, 120, 180, 20), (cx, cy), cr)
+            pygame.draw.circle(cs, (140, 160, 220, 35), (cx, cy), cr, 2)
+            pygame.draw.circle(cs, (160, 180, 255, 15), (cx, cy), int(cr * 0.5))
+        surf.blit(cs, (0, 0))
 
     def _bake_nebula(self, rng):
         # Stars — magenta/teal hues
@@ -265,6 +572,14 @@ class TerrainRenderer:
                 'size': rng.randint(4, 18), 'angle': rng.uniform(0, math.pi),
                 'col': rng.choice([(0, 220, 180, 60), (200, 0, 255, 50), (0, 180, 255, 55)])
             })
+        # Crystal vertex offsets at angle 0; rotated as a batch each frame
+        k = np.array([0, 1.5, math.pi, -1.5])
+        size = np.array([cr['size'] for cr in self.bg_crystals], dtype=float)[:, None]
+        rad = size * np.array([1.0, 0.9, 1.0, 0.9])  # hw, hh*0.3, hw, hh*0.3 with hh = 3*size
+        self.crystal_bx, self.crystal_by = np.cos(k) * rad, np.sin(k) * rad
+        self.crystal_x = np.array([cr['x'] for cr in self.bg_crystals], dtype=float)[:, None]
+        self.crystal_y = np.array([cr['y'] for cr in self.bg_crystals], dtype=float)[:, None]
+        self.crystal_angle = np.array([cr['angle'] for cr in self.bg_crystals])
         # Flowing nebula streaks
         self.streaks = []
         for _ in range(20):
@@ -274,6 +589,28 @@ class TerrainRenderer:
                 'col': rng.choice([(0,255,200,20),(180,0,255,18),(0,150,255,15)])
             })
 
+        # Static layer — stars and streaks; clouds drift and crystals spin
+        self.static_surf = surf = self._new_static_surf()
+        sb = self._star_brightness()
+        dim = (sb * 0.3).astype(np.int32)
+        tint = np.stack([np.stack([sb, dim, sb], axis=1),
+                         np.stack([dim, sb, (sb * 0.8).astype(np.int32)], axis=1)])
+        parity = np.array([(st[0] + st[1]) % 2 for st in self.stars])
+        self._bake_stars(surf, tint[parity, np.arange(len(sb))])
+        ss2 = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
+        for sk in self.streaks:
+            pygame.draw.line(ss2, sk['col'], (sk['x1'], sk['y1']), (sk['x2'], sk['y2']), 1)
+        surf.blit(ss2, (0, 0))
+
+        # Gas cloud sprites, one ellipse each, blitted with a horizontal drift per frame
+        hue_cols = {'teal': (0, 230, 200), 'magenta': (220, 0, 255), 'purple': (120, 0, 200)}
+        for cloud in self.gas_clouds:
+            rx, ry = cloud['rx'], cloud['ry']
+            tex = pygame.Surface((rx * 2, ry * 2), pygame.SRCALPHA)
+            pygame.draw.ellipse(tex, hue_cols[cloud['hue']] + (cloud['alpha'],), tex.get_rect())
+            cloud['tex'] = tex.convert_alpha()
+        self.cloud_phase = np.array([cl['x'] * 0.01 for cl in self.gas_clouds])
+
     def _bake_asteroid_graveyard(self, rng):
         # Stars — warm orange
         self.stars = [(rng.randint(0, SCREEN_W), rng.randint(0, SCREEN_H),
@@ -322,6 +659,28 @@ class TerrainRenderer:
                 'alpha': rng.randint(10, 35)
             })
 
+        # Static layer — stars, ruin arches, silhouettes and rubble
+        self.static_surf = surf = self._new_static_surf()
+        sb = self._star_brightness()
+        self._bake_stars(surf, np.stack([sb, (sb * 0.7).astype(np.int32),
+                                         (sb * 0.3).astype(np.int32)], axis=1))
+        arch_s = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
+        for arch in self.arches:
+            rect = pygame.Rect(arch['cx'] - arch['r'], arch['cy'] - arch['r'],
+                               arch['r'] * 2, arch['r'] * 2)
+            pygame.draw.arc(arch_s, (180, 100, 40, 70), rect,
+                            arch['start'], arch['start'] + arch['span'], 4)
+        surf.blit(arch_s, (0, 0))
+        ba = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
+        for ast in self.bg_asteroids:
+            pygame.draw.polygon(ba, (100, 60, 20, ast['alpha']), ast['pts'])
+            pygame.draw.polygon(ba, (160, 100, 50, ast['alpha'] + 20), ast['pts'], 2)
+        surf.blit(ba, (0, 0))
+        rb = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
+        for rub in self.rubble:
+            pygame.draw.circle(rb, (150, 90, 40, rub['alpha']), (rub['x'], rub['y']), rub['r'])
+        surf.blit(rb, (0, 0))
+
     def _bake_black_hole_station(self, rng):
         # Stars — deep red
         self.stars = [(rng.randint(0, SCREEN_W), rng.randint(0, SCREEN_H),
@@ -354,13 +713,30 @@ class TerrainRenderer:
                 'angle': rng.uniform(-0.4, 0.4)
             })
         # Glowing red event horizons (decorative small circles)
-        self.mini_horizons = []
-        for _ in range(8):
-            self.mini_horizons.append({
-                'x': rng.randint(60, SCREEN_W - 60),
-                'y': rng.randint(80, SCREEN_H - 80),
-                'r': rng.randint(8, 22),
-            })
+        self.mh_x, self.mh_y, self.mh_r = np.array(
+            [(rng.randint(60, SCREEN_W - 60), rng.randint(80, SCREEN_H - 80), rng.randint(8, 22))
+             for _ in range(8)], dtype=np.int32).T.copy()
+
+        # Static layer — stars and corridor panels
+        self.static_surf = surf = self._new_static_surf()
+        sb = self._star_brightness()
+        dim = (sb * 0.2).astype(np.int32)
+        self._bake_stars(surf, np.stack([sb, dim, dim], axis=1))
+        ps = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
+        for panel in self.panels:
+            pygame.draw.rect(ps, (60, 0, 10, 150), panel)
+            pygame.draw.rect(ps, (200, 30, 60, 180), panel, 1)
+        surf.blit(ps, (0, 0))
+
+        # Warning stripe sprites, drawn opaque once and faded per frame with set_alpha
+        for stripe in self.warning_stripes:
+            w, h = stripe['w'], stripe['h']
+            tex = pygame.Surface((w, h), pygame.SRCALPHA)
+            for i in range(0, w + h, 14):
+                pygame.draw.line(tex, (255, 30, 60), (i, 0), (max(0, i - h), h), 3)
+            stripe['tex'] = tex.convert_alpha()
+            stripe['pos'] = (stripe['x'] - w // 2, stripe['y'] - h // 2)
+        self.stripe_phase = np.array([st['x'] * 0.1 for st in self.warning_stripes])
 
     def _bake_pulsar_core(self, rng):
         # Stars — bright electric
@@ -378,6 +754,8 @@ class TerrainRenderer:
                 hy = 140 + r * 155
                 if 60 < hx < SCREEN_W - 60 and 80 < hy < SCREEN_H - 80:
                     self.hex_nodes.append((hx, hy, rng.randint(18, 35)))
+        self.hex_pts = [(HEX_OFFSETS * hr + (hx, hy)).astype(np.int32).tolist()
+                        for hx, hy, hr in self.hex_nodes]
         # Diagonal energy beams
         self.energy_beams = []
         for _ in range(10):
@@ -387,195 +765,115 @@ class TerrainRenderer:
                 'alpha': rng.randint(8, 25)
             })
 
-    def draw(self, surf, t: float):
-        lid = self.level_id
-        if lid == 0:   self._draw_lunar(surf, t)
-        elif lid == 1: self._draw_nebula(surf, t)
-        elif lid == 2: self._draw_asteroid_graveyard(surf, t)
-        elif lid == 3: self._draw_black_hole_station(surf, t)
-        elif lid == 4: self._draw_pulsar_core(surf, t)
+        # Per-element animation phases, evaluated with one np.sin per frame
+        self.star_x, self.star_y, self.star_sb, self.star_r = (
+            np.array(self.stars, dtype=np.int32).reshape(-1, 4).T.copy())
+        self.star_phase = self.star_x * 0.1
+        self.hex_phase  = np.array([hx * 0.05 for hx, _, _ in self.hex_nodes])
+        self.beam_phase = np.array([b['x1'] for b in self.energy_beams], dtype=float)
+
+        # Beam sprites cropped to each line, faded per frame with set_alpha
+        for beam in self.energy_beams:
+            x0, y0 = min(beam['x1'], beam['x2']), min(beam['y1'], beam['y2'])
+            tex = pygame.Surface((abs(beam['x2'] - beam['x1']) + 1,
+                                  abs(beam['y2'] - beam['y1']) + 1), pygame.SRCALPHA)
+            pygame.draw.line(tex, (255, 240, 0, beam['alpha']),
+                             (beam['x1'] - x0, beam['y1'] - y0), (beam['x2'] - x0, beam['y2'] - y0), 1)
+            beam['tex'] = tex.convert_alpha()
+            beam['pos'] = (x0, y0)
+
+        # Static layer is bare background; every element here animates.
+        # The grid pulses uniformly, so it is baked opaque and faded with set_alpha.
+        self.static_surf = self._new_static_surf()
+        self.grid_surf = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA).convert_alpha()
+        for gy in self.grid_h:
+            pygame.draw.line(self.grid_surf, (0, 200, 255), (0, gy), (SCREEN_W, gy), 1)
+        for gx in self.grid_v:
+            pygame.draw.line(self.grid_surf, (0, 200, 255), (gx, 64), (gx, SCREEN_H), 1)
 
     # ── LEVEL 0: LUNAR ────────────────────────────────────────────────────────
     def _draw_lunar(self, surf, t):
-        # Stars
-        for sx, sy, sb, ss in self.stars:
-            pygame.draw.circle(surf, (sb, sb, min(255, sb + 30)), (sx, sy), ss)
-
-        # Dust patches
-        ds = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-        for px, py, pw, ph in self.dust_patches:
-            pygame.draw.ellipse(ds, (180, 190, 220, 22), (px - pw, py - ph, pw * 2, ph * 2))
-        surf.blit(ds, (0, 0))
-
-        # Rocky ridges
-        for pts in self.ridges:
-            pygame.draw.polygon(surf, (28, 32, 52), pts)
-            pygame.draw.lines(surf, (60, 70, 110), False, pts[:-2], 2)
-
-        # Crater circles
-        cs = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-        for cx, cy, cr in self.craters:
-            pygame.draw.circle(cs, (100, 120, 180, 20), (cx, cy), cr)
-            pygame.draw.circle(cs, (140, 160, 220, 35), (cx, cy), cr, 2)
-            pygame.draw.circle(cs, (160, 180, 255, 15), (cx, cy), int(cr * 0.5))
-        surf.blit(cs, (0, 0))
-
         # Arena rings (animated slow pulse)
         pulse = 0.5 + 0.5 * math.sin(t * 0.8)
-        for cx, cy, cr in self.arena_rings:
-            a = pygame.Surface((cr * 2 + 4, cr * 2 + 4), pygame.SRCALPHA)
-            alpha = int(30 + pulse * 20)
-            pygame.draw.circle(a, (140, 160, 255, alpha), (cr + 2, cr + 2), cr, 2)
+        alpha = int(30 + pulse * 20)
+        for (cx, cy, cr), a in zip(self.arena_rings, self.arena_ring_texs):
+            a.set_alpha(alpha)
             surf.blit(a, (cx - cr - 2, cy - cr - 2))
 
     # ── LEVEL 1: NEBULA ───────────────────────────────────────────────────────
     def _draw_nebula(self, surf, t):
-        # Stars with tinted colors
-        for sx, sy, sb, ss in self.stars:
-            tint = [(sb, int(sb * 0.3), sb), (int(sb * 0.3), sb, int(sb * 0.8))]
-            col = tint[(sx + sy) % 2]
-            pygame.draw.circle(surf, col, (sx, sy), ss)
-
         # Gas clouds
-        gs = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-        for cloud in self.gas_clouds:
-            drift = math.sin(t * 0.3 + cloud['x'] * 0.01) * 8
-            if cloud['hue'] == 'teal':    col = (0, 230, 200, cloud['alpha'])
-            elif cloud['hue'] == 'magenta': col = (220, 0, 255, cloud['alpha'])
-            else:                           col = (120, 0, 200, cloud['alpha'])
-            pygame.draw.ellipse(gs, col,
-                (cloud['x'] - cloud['rx'] + drift, cloud['y'] - cloud['ry'],
-                 cloud['rx'] * 2, cloud['ry'] * 2))
-        surf.blit(gs, (0, 0))
-
-        # Streaks
-        ss2 = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-        for sk in self.streaks:
-            pygame.draw.line(ss2, sk['col'], (sk['x1'], sk['y1']), (sk['x2'], sk['y2']), 1)
-        surf.blit(ss2, (0, 0))
+        drift = (np.sin(t * 0.3 + self.cloud_phase) * 8).astype(np.int32)
+        for cloud, dx in zip(self.gas_clouds, drift.tolist()):
+            surf.blit(cloud['tex'], (cloud['x'] - cloud['rx'] + dx, cloud['y'] - cloud['ry']))
 
         # Background crystals
-        cs = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-        for cr in self.bg_crystals:
-            a = cr['angle'] + t * 0.2
-            hw = cr['size']; hh = cr['size'] * 3
-            pts = [
-                (cr['x'] + math.cos(a) * hw,          cr['y'] + math.sin(a) * hw),
-                (cr['x'] + math.cos(a + 1.5) * hh * 0.3, cr['y'] + math.sin(a + 1.5) * hh * 0.3),
-                (cr['x'] + math.cos(a + math.pi) * hw, cr['y'] + math.sin(a + math.pi) * hw),
-                (cr['x'] + math.cos(a - 1.5) * hh * 0.3, cr['y'] + math.sin(a - 1.5) * hh * 0.3),
-            ]
-            pts_int = [(int(p[0]), int(p[1])) for p in pts]
-            if len(pts_int) >= 3:
-                pygame.draw.polygon(cs, cr['col'], pts_int)
+        cs = self._clear_scratch()
+        a = self.crystal_angle + t * 0.2
+        c, s = np.cos(a)[:, None], np.sin(a)[:, None]
+        bx, by = self.crystal_bx, self.crystal_by
+        pts = np.stack([self.crystal_x + c * bx - s * by,
+                        self.crystal_y + s * bx + c * by], axis=2).astype(np.int32).tolist()
+        for cr, pts_int in zip(self.bg_crystals, pts):
+            pygame.draw.polygon(cs, cr['col'], pts_int)
         surf.blit(cs, (0, 0))
 
     # ── LEVEL 2: ASTEROID GRAVEYARD ───────────────────────────────────────────
     def _draw_asteroid_graveyard(self, surf, t):
-        # Stars with warm tint
-        for sx, sy, sb, ss in self.stars:
-            pygame.draw.circle(surf, (sb, int(sb * 0.7), int(sb * 0.3)), (sx, sy), ss)
-
         # Dust columns
-        dc = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
+        dc = self._clear_scratch()
         for col in self.dust_cols:
             drift = math.sin(t * 0.4 + col['x'] * 0.02) * 5
             pygame.draw.rect(dc, (200, 120, 60, col['alpha']),
                 (col['x'] + drift, col['y'], col['w'], col['h']))
         surf.blit(dc, (0, 0))
 
-        # Ruin arches
-        arch_s = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-        for arch in self.arches:
-            rect = pygame.Rect(arch['cx'] - arch['r'], arch['cy'] - arch['r'],
-                               arch['r'] * 2, arch['r'] * 2)
-            pygame.draw.arc(arch_s, (180, 100, 40, 70), rect,
-                            arch['start'], arch['start'] + arch['span'], 4)
-        surf.blit(arch_s, (0, 0))
-
-        # Background asteroids
-        ba = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-        for ast in self.bg_asteroids:
-            pygame.draw.polygon(ba, (100, 60, 20, ast['alpha']), ast['pts'])
-            pygame.draw.polygon(ba, (160, 100, 50, ast['alpha'] + 20), ast['pts'], 2)
-        surf.blit(ba, (0, 0))
-
-        # Rubble
-        rb = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-        for rub in self.rubble:
-            pygame.draw.circle(rb, (150, 90, 40, rub['alpha']), (rub['x'], rub['y']), rub['r'])
-        surf.blit(rb, (0, 0))
-
     # ── LEVEL 3: BLACK HOLE STATION ───────────────────────────────────────────
     def _draw_black_hole_station(self, surf, t):
-        # Stars (dim red)
-        for sx, sy, sb, ss in self.stars:
-            pygame.draw.circle(surf, (sb, int(sb * 0.2), int(sb * 0.2)), (sx, sy), ss)
-
-        # Station panels
-        ps = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-        for panel in self.panels:
-            pygame.draw.rect(ps, (60, 0, 10, 150), panel)
-            pygame.draw.rect(ps, (200, 30, 60, 180), panel, 1)
-        surf.blit(ps, (0, 0))
-
         # Warning stripes (static danger zones)
-        ws = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-        for stripe in self.warning_stripes:
-            pulse = 0.3 + 0.3 * math.sin(t * 2 + stripe['x'] * 0.1)
-            alpha = int(10 + pulse * 15)
-            rect_surf = pygame.Surface((stripe['w'], stripe['h']), pygame.SRCALPHA)
-            # Draw diagonal lines
-            for i in range(0, stripe['w'] + stripe['h'], 14):
-                pygame.draw.line(rect_surf, (255, 30, 60, alpha),
-                                 (i, 0), (max(0, i - stripe['h']), stripe['h']), 3)
-            ws.blit(rect_surf, (stripe['x'] - stripe['w'] // 2, stripe['y'] - stripe['h'] // 2))
-        surf.blit(ws, (0, 0))
+        stripe_alpha = (10 + (0.3 + 0.3 * np.sin(t * 2 + self.stripe_phase)) * 15).astype(np.int32)
+        for stripe, a in zip(self.warning_stripes, stripe_alpha.tolist()):
+            stripe['tex'].set_alpha(a)
+            surf.blit(stripe['tex'], stripe['pos'])
 
         # Mini event horizons (pulsing)
-        mh = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-        for mh_data in self.mini_horizons:
-            pulse = 0.5 + 0.5 * math.sin(t * 3 + mh_data['x'])
-            r = mh_data['r']
-            pygame.draw.circle(mh, (200, 0, 40, int(40 + pulse * 30)), (mh_data['x'], mh_data['y']), r)
-            pygame.draw.circle(mh, (255, 60, 100, int(80 + pulse * 40)), (mh_data['x'], mh_data['y']), r, 2)
+        pulse = 0.5 + 0.5 * np.sin(t * 3 + self.mh_x)
+        fill_a = (40 + pulse * 30).astype(np.int32)
+        ring_a = (80 + pulse * 40).astype(np.int32)
+        mh = self._clear_scratch()
+        for x, y, r, fa, ra in zip(self.mh_x.tolist(), self.mh_y.tolist(), self.mh_r.tolist(),
+                                   fill_a.tolist(), ring_a.tolist()):
+            pygame.draw.circle(mh, (200, 0, 40, fa), (x, y), r)
+            pygame.draw.circle(mh, (255, 60, 100, ra), (x, y), r, 2)
         surf.blit(mh, (0, 0))
 
     # ── LEVEL 4: PULSAR CORE ──────────────────────────────────────────────────
     def _draw_pulsar_core(self, surf, t):
-        # Stars (bright, varied)
-        for sx, sy, sb, ss in self.stars:
-            twinkle = int(sb * (0.7 + 0.3 * math.sin(t * 3 + sx * 0.1)))
-            pygame.draw.circle(surf, (int(twinkle * 0.4), twinkle, twinkle), (sx, sy), ss)
+        # Stars (bright, varied) — written straight into the pixel buffer
+        twinkle = self.star_sb * (0.7 + 0.3 * np.sin(t * 3 + self.star_phase))
+        tw = twinkle.astype(np.uint8)
+        cols = np.stack([(tw * 0.4).astype(np.uint8), tw, tw], axis=1)
+        pixels = pygame.surfarray.pixels3d(surf)
+        splat(pixels, None, self.star_x, self.star_y, self.star_r, cols)
+        del pixels
 
         # Grid
-        grid_s = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-        pulse = int(8 + 6 * math.sin(t * 1.5))
-        for gy in self.grid_h:
-            pygame.draw.line(grid_s, (0, 200, 255, pulse), (0, gy), (SCREEN_W, gy), 1)
-        for gx in self.grid_v:
-            pygame.draw.line(grid_s, (0, 200, 255, pulse), (gx, 64), (gx, SCREEN_H), 1)
-        surf.blit(grid_s, (0, 0))
+        self.grid_surf.set_alpha(int(8 + 6 * math.sin(t * 1.5)))
+        surf.blit(self.grid_surf, (0, 0))
 
         # Hex nodes
-        hn = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-        for hx, hy, hr in self.hex_nodes:
-            pulse2 = 0.5 + 0.5 * math.sin(t * 2 + hx * 0.05)
-            alpha = int(20 + pulse2 * 35)
-            pts = [(int(hx + math.cos(math.radians(a)) * hr),
-                    int(hy + math.sin(math.radians(a)) * hr))
-                   for a in range(0, 360, 60)]
+        hn = self._clear_scratch()
+        alphas = (20 + (0.5 + 0.5 * np.sin(t * 2 + self.hex_phase)) * 35).astype(np.int32)
+        for pts, alpha in zip(self.hex_pts, alphas.tolist()):
             pygame.draw.polygon(hn, (0, 220, 255, alpha), pts)
             pygame.draw.polygon(hn, (0, 255, 255, alpha + 40), pts, 1)
         surf.blit(hn, (0, 0))
 
         # Energy beams
-        eb = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-        for beam in self.energy_beams:
-            flicker = int(beam['alpha'] * (0.5 + 0.5 * math.sin(t * 4 + beam['x1'])))
-            pygame.draw.line(eb, (255, 240, 0, flicker),
-                             (beam['x1'], beam['y1']), (beam['x2'], beam['y2']), 1)
-        surf.blit(eb, (0, 0))
+        flickers = (255 * (0.5 + 0.5 * np.sin(t * 4 + self.beam_phase))).astype(np.int32)
+        for beam, flicker in zip(self.energy_beams, flickers.tolist()):
+            beam['tex'].set_alpha(flicker)
+            surf.blit(beam['tex'], beam['pos'])
 
 
 # ─── GRAVITY ANOMALY ──────────────────────────────────────────────────────────
@@ -584,6 +882,7 @@ class GravityAnomaly:
     x: float; y: float
     radius: float; strength: float
     kind: str  # "black_hole" | "repulsor" | "nebula"
+    cached_surf: Optional[pygame.Surface] = field(default=None, repr=False)  # static glow stack
 
 @dataclass
 class BoostPad:
@@ -592,16 +891,6 @@ class BoostPad:
     active: bool = True
     cooldown: float = 0.0
 
-@dataclass
-class MovingAsteroid:
-    x: float; y: float
-    radius: float
-    vx: float; vy: float
-    angle: float = 0.0
-    spin: float = 0.0
-    # Level 2 asteroids can spin fast; level 3 slow drift
-    color: tuple = (130, 110, 90)
-
 
 # ─── LEVEL MAP ────────────────────────────────────────────────────────────────
 class LevelMap:
@@ -613,25 +902,28 @@ class LevelMap:
 
         self.anomalies:   List[GravityAnomaly] = []
         self.boost_pads:  List[BoostPad]       = []
-        self.asteroids:   List[MovingAsteroid] = []
-        self.pulse_rings: List[PulseRing]      = []
-        self.lightning:   List[LightningNode]  = []
         self.crystal_shards: List[CrystalShard] = []
         self.gravity_corridors: List[GravityCorridor] = []
 
         self.terrain = TerrainRenderer(level_id, rng)
+        # Shared overlay for translucent hazards; only each hazard's box is touched
+        self._fx_surf = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA).convert_alpha()
         self._generate()
+        self._pack_force_fields()
 
     def _generate(self):
         rng = self.rng
         cfg = self.cfg
 
         # ── Boost pads ──
-        pads = [(SCREEN_W // 2, SCREEN_H // 2)]
+        pads = [(CX, CY)]
         for _ in range(rng.randint(3, 6)):
             pads.append((rng.randint(120, SCREEN_W - 120), rng.randint(90, SCREEN_H - 90)))
         for px, py in pads:
             self.boost_pads.append(BoostPad(px, py))
+        # Indices of pads that can be picked up; kept in step with pad.active
+        self.active_pads = set(range(len(self.boost_pads)))
+        self.pad_events: deque = deque()   # pad indices picked up since last drained
 
         # ── Gravity anomalies ──
         kinds = cfg["anomaly_types"]
@@ -644,22 +936,30 @@ class LevelMap:
             if kind == "nebula": s = rng.uniform(25, 55)
             self.anomalies.append(GravityAnomaly(ax, ay, r, s, kind))
 
-        # ── Moving asteroids ──
+        # ── Moving asteroids (one array per field) ──
+        lid = self.level_id
+        spd = 60 if lid == 3 else 80  # slower in BH station
+        self.ast_color = {
+            2: (160, 100, 50),
+            3: (120, 20, 40),
+        }.get(lid, (130, 110, 90))
+        rows = []
         for _ in range(cfg["max_asteroids"]):
-            lid = self.level_id
-            spd = 60 if lid == 3 else 80  # slower in BH station
-            col = {
-                2: (160, 100, 50),
-                3: (120, 20, 40),
-            }.get(lid, (130, 110, 90))
-            self.asteroids.append(MovingAsteroid(
+            rows.append((
                 rng.randint(200, SCREEN_W - 200), rng.randint(90, SCREEN_H - 90),
                 rng.randint(14, 32),
                 rng.uniform(-spd, spd), rng.uniform(-spd * 0.8, spd * 0.8),
                 rng.uniform(0, math.pi * 2),
-                rng.uniform(-2.5, 2.5),
-                col
+                rng.uniform(-2.5, 2.5),  # level 2 asteroids spin fast; level 3 slow drift
             ))
+        (self.ast_x, self.ast_y, self.ast_r, self.ast_vx, self.ast_vy,
+         self.ast_ang, self.ast_spin) = np.array(rows, dtype=float).reshape(-1, 7).T.copy()
+        # Outline radii at each of the 10 vertices; only the rotation changes per frame
+        self.ast_profile = self.ast_r[:, None] * (0.65 + 0.35 * ((np.arange(10) * 7 + 3) % 5) / 4)
+        self.ast_rim = tuple(min(255, c + 50) for c in self.ast_color)
+        # Broad-phase grid: cells as wide as the largest asteroid, rebuilt as they move
+        self._grid_cell = 2 * int(self.ast_r.max()) if len(self.ast_r) else 64
+        self._rebuild_grid()
 
         # ── Level-specific hazards ──
         hazards = cfg["hazards"]
@@ -682,121 +982,144 @@ class LevelMap:
                     rng.uniform(0, math.pi * 2)
                 ))
 
+        rows = []
         if "pulse_rings" in hazards:
             for _ in range(3):
-                self.pulse_rings.append(PulseRing(
+                rows.append((
                     rng.randint(200, SCREEN_W - 200), rng.randint(100, SCREEN_H - 100),
                     10, rng.randint(80, 160),
                     rng.uniform(80, 160),
-                    self.cfg["accent"]
                 ))
+        (self.pr_cx, self.pr_cy, self.pr_radius, self.pr_max,
+         self.pr_speed) = np.array(rows, dtype=float).reshape(-1, 5).T.copy()
 
+        rows = []
         if "lightning_nodes" in hazards:
             for _ in range(5):
-                self.lightning.append(LightningNode(
+                rows.append((
                     rng.randint(150, SCREEN_W - 150), rng.randint(80, SCREEN_H - 80),
-                    rng.uniform(1.5, 4.0), False,
-                    rng.randint(50, 90)
+                    rng.uniform(1.5, 4.0),
+                    rng.randint(50, 90),
                 ))
+        (self.ln_x, self.ln_y, self.ln_timer,
+         self.ln_r) = np.array(rows, dtype=float).reshape(-1, 4).T.copy()
+        self.ln_active = np.zeros(len(rows), dtype=np.bool_)
+        # Only Pulsar Core has contact hazards; elsewhere the hit test is skipped
+        self.has_hazards = bool(len(self.ln_x) or len(self.pr_cx))
+
+    def _pack_force_fields(self):
+        """Flat per-kind arrays of anomaly and corridor data for the gravity pass."""
+        an = self.anomalies
+        self.neb_xyr = np.array([(a.x, a.y, a.radius) for a in an if a.kind == "nebula"],
+                                dtype=np.float32).reshape(-1, 3)
+        self.grav_xyrs = np.array([(a.x, a.y, a.radius, a.strength) for a in an
+                                   if a.kind != "nebula"], dtype=np.float32).reshape(-1, 4)
+        gcs = self.gravity_corridors
+        self.gc_xy   = np.array([(gc.x, gc.y) for gc in gcs], dtype=float).reshape(-1, 2)
+        self.gc_half = np.array([(gc.hw, gc.hh) for gc in gcs], dtype=float).reshape(-1, 2)
+        self.gc_push = np.array([(gc.cos_d * gc.strength, gc.sin_d * gc.strength) for gc in gcs],
+                                dtype=float).reshape(-1, 2)
 
     def update(self, dt: float):
         # Boost pad cooldowns
-        for pad in self.boost_pads:
-            if not pad.active:
-                pad.cooldown -= dt
-                if pad.cooldown <= 0:
-                    pad.active = True
+        if len(self.active_pads) < len(self.boost_pads):
+            for i, pad in enumerate(self.boost_pads):
+                if not pad.active:
+                    pad.cooldown -= dt
+                    if pad.cooldown <= 0:
+                        pad.active = True; self.active_pads.add(i)
 
         # Asteroids
-        for ast in self.asteroids:
-            ast.x += ast.vx * dt
-            ast.y += ast.vy * dt
-            ast.angle += ast.spin * dt
-            if ast.x < ast.radius or ast.x > SCREEN_W - ast.radius: ast.vx *= -1
-            if ast.y < ast.radius or ast.y > SCREEN_H - ast.radius: ast.vy *= -1
+        self.ast_x += self.ast_vx * dt
+        self.ast_y += self.ast_vy * dt
+        self.ast_ang += self.ast_spin * dt
+        r = self.ast_r
+        self.ast_vx *= 1.0 - 2.0 * ((self.ast_x < r) | (self.ast_x > SCREEN_W - r))
+        self.ast_vy *= 1.0 - 2.0 * ((self.ast_y < r) | (self.ast_y > SCREEN_H - r))
+        np.clip(self.ast_x, r, SCREEN_W - r, out=self.ast_x)
+        np.clip(self.ast_y, r, SCREEN_H - r, out=self.ast_y)
+        self._rebuild_grid()
 
         # Crystal shards (orbit slowly)
         for cs in self.crystal_shards:
             cs.angle += cs.spin * dt
 
         # Pulse rings
-        for pr in self.pulse_rings:
-            pr.radius += pr.speed * dt
-            if pr.radius > pr.max_radius:
-                pr.radius = 10
+        self.pr_radius += self.pr_speed * dt
+        self.pr_radius[self.pr_radius > self.pr_max] = 10
 
         # Lightning nodes
-        for ln in self.lightning:
-            ln.timer -= dt
-            if ln.timer <= 0:
-                ln.active = not ln.active
-                ln.timer = random.uniform(0.4, 2.5) if ln.active else random.uniform(1.0, 4.0)
-
-    def apply_gravity(self, ox, oy, vx, vy, mass=1.0, dt=0.016):
-        for a in self.anomalies:
-            dx = a.x - ox; dy = a.y - oy
-            dist = max(1, math.sqrt(dx**2 + dy**2))
-            if a.kind == "nebula":
-                if dist < a.radius:
-                    vx *= (1 - 0.35 * dt)
-                    vy *= (1 - 0.35 * dt)
-            else:
-                if dist < a.radius * 3:
-                    force = (a.strength / (dist**1.2)) * dt / mass
-                    nx, ny = dx / dist, dy / dist
-                    vx += nx * force; vy += ny * force
-
-        # Gravity corridors (level 3)
-        for gc in self.gravity_corridors:
-            dx = ox - gc.x; dy = oy - gc.y
-            # Corridor check (simple rectangle)
-            if abs(dx) < gc.width / 2 and abs(dy) < gc.height / 2:
-                nx = math.cos(gc.direction)
-                ny = math.sin(gc.direction)
-                vx += nx * gc.strength * dt / mass
-                vy += ny * gc.strength * dt / mass
-
-        return vx, vy
+        _update_lightning(self.ln_timer, self.ln_active, dt)
+
+    def take_pad(self, i):
+        pad = self.boost_pads[i]
+        pad.active = False; pad.cooldown = 5.0
+        self.active_pads.discard(i)
+        self.pad_events.append(i)
+
+    def _rebuild_grid(self):
+        cell = self._grid_cell
+        grid = {}
+        for ax, ay, ar in zip(self.ast_x.tolist(), self.ast_y.tolist(), self.ast_r.tolist()):
+            grid.setdefault((int(ax // cell), int(ay // cell)), []).append((ax, ay, ar))
+        self._grid = grid
+
+    def query(self, x, y, r):
+        """Yield (x, y, radius) of asteroids in the grid cells within r + cell of (x, y)."""
+        cell = self._grid_cell
+        reach = math.ceil((r + cell) / cell)
+        gx, gy = int(x // cell), int(y // cell)
+        grid = self._grid
+        for cx in range(gx - reach, gx + reach + 1):
+            for cy in range(gy - reach, gy + reach + 1):
+                hits = grid.get((cx, cy))
+                if hits: yield from hits
+
+    def apply_gravity_batch(self, pos, vel, mass, dt):
+        """Anomaly and corridor forces for every moving object in one pass.
+
+        pos and vel are (N, 2) arrays and mass is (N,); vel is updated in place.
+        """
+        _apply_gravity_batch(pos, vel, mass, self.grav_xyrs, self.neb_xyr,
+                             self.gc_xy, self.gc_half, self.gc_push, dt)
 
     def check_hazard_hit(self, ox, oy, radius) -> bool:
         """Returns True if object touches a hazard."""
-        # Lightning nodes
-        for ln in self.lightning:
-            if ln.active:
-                d = math.sqrt((ox - ln.x)**2 + (oy - ln.y)**2)
-                if d < ln.radius + radius:
-                    return True
-        # Pulse rings (thin ring collision)
-        for pr in self.pulse_rings:
-            d = math.sqrt((ox - pr.cx)**2 + (oy - pr.cy)**2)
-            if abs(d - pr.radius) < 10 + radius:
-                return True
-        return False
+        if not self.has_hazards: return False
+        return _hazard_hit(ox, oy, radius, self.ln_x, self.ln_y, self.ln_r, self.ln_active,
+                           self.pr_cx, self.pr_cy, self.pr_radius)
 
-    def draw(self, surf, t: float):
-        self.terrain.draw(surf, t)
+    def draw_dynamic(self, surf, t: float):
+        """Everything above the baked terrain background, which the caller has blitted."""
+        self.terrain.draw_dynamic(surf, t)
 
-        # Anomalies
+        # Anomalies: every glow sprite in one blits() call, then rims and orbit lines
+        surf.blits([self._anomaly_glow(a, t) for a in self.anomalies], doreturn=False)
         for a in self.anomalies:
             if   a.kind == "black_hole": self._draw_bh(surf, a, t)
             elif a.kind == "repulsor":   self._draw_repulsor(surf, a, t)
-            elif a.kind == "nebula":     self._draw_nebula_zone(surf, a, t)
 
         # Asteroids
-        for ast in self.asteroids:
-            self._draw_asteroid(surf, ast)
+        ang = self.ast_ang[:, None] + np.arange(10) * (math.pi / 5)
+        px = (self.ast_x[:, None] + np.cos(ang) * self.ast_profile).astype(np.int32)
+        py = (self.ast_y[:, None] + np.sin(ang) * self.ast_profile).astype(np.int32)
+        for pts in np.stack([px, py], axis=2).tolist():
+            pygame.draw.polygon(surf, self.ast_color, pts)
+            pygame.draw.polygon(surf, self.ast_rim, pts, 2)
 
         # Crystal shards
         for cs in self.crystal_shards:
             self._draw_crystal(surf, cs, t)
 
         # Pulse rings
-        for pr in self.pulse_rings:
-            self._draw_pulse_ring(surf, pr, t)
+        for cx, cy, pr_r, pr_max in zip(self.pr_cx.tolist(), self.pr_cy.tolist(),
+                                        self.pr_radius.tolist(), self.pr_max.tolist()):
+            self._draw_pulse_ring(surf, cx, cy, pr_r, pr_max, t)
 
         # Lightning nodes
-        for ln in self.lightning:
-            self._draw_lightning(surf, ln, t)
+        for lx, ly, lr, on in zip(self.ln_x.tolist(), self.ln_y.tolist(),
+                                  self.ln_r.tolist(), self.ln_active.tolist()):
+            self._draw_lightning(surf, lx, ly, lr, on, t)
 
         # Gravity corridors
         for gc in self.gravity_corridors:
@@ -805,14 +1128,47 @@ class LevelMap:
         # Boost pads
         self._draw_boosts(surf, t)
 
+    def _fx_layer(self, x, y, reach):
+        """Clear the square of half-size reach around (x, y) on the fx layer."""
+        box = pygame.Rect(int(x - reach), int(y - reach), int(reach * 2) + 1, int(reach * 2) + 1)
+        box = box.clip(self._fx_surf.get_rect())
+        self._fx_surf.fill((0, 0, 0, 0), box)
+        return self._fx_surf, box
+
+    @staticmethod
+    def _glow_stack(a, rings):
+        """Bake concentric (r, rgba) discs centred on the anomaly into one sprite.
+
+        The stack is kept premultiplied so it composites exactly like blitting
+        each disc in turn; blit it with BLEND_PREMULTIPLIED.
+        """
+        R = int(a.radius)
+        s = pygame.Surface((R * 2, R * 2), pygame.SRCALPHA)
+        for r, rgba in rings:
+            s.blit(alpha_disk(r, rgba).premul_alpha(), (R - r, R - r),
+                   special_flags=pygame.BLEND_PREMULTIPLIED)
+        return s.convert_alpha()
+
+    def _anomaly_glow(self, a, t):
+        """(sprite, pos, area, flags) blits() item for the anomaly's translucent glow."""
+        if a.kind == "repulsor":
+            pulse = 0.5 + 0.5 * math.sin(t * 2)
+            return (alpha_disk(int(a.radius), (0, 180, 255, int(18 + pulse * 15))),
+                    (int(a.x - a.radius), int(a.y - a.radius)), None, 0)
+        R = int(a.radius)
+        if a.cached_surf is None and a.kind == "black_hole":
+            a.cached_surf = s = self._glow_stack(
+                a, [(int(a.radius * i / 5), (140, 0, 60, max(0, 70 - i * 12))) for i in range(5, 0, -1)])
+            pygame.draw.circle(s, (8, 0, 2), (R, R), int(a.radius * 0.28))
+        elif a.cached_surf is None:
+            a.cached_surf = s = self._glow_stack(
+                a, [(int(a.radius * (1 - i * 0.25)),
+                     ((60, 0, 140) if i % 2 == 0 else (0, 200, 160)) + (12 + i * 8,))
+                    for i in range(3)])
+            pygame.draw.circle(s, (80, 0, 180), (R, R), R, 1)
+        return a.cached_surf, (int(a.x) - R, int(a.y) - R), None, pygame.BLEND_PREMULTIPLIED
+
     def _draw_bh(self, surf, a, t):
-        for i in range(5, 0, -1):
-            r = int(a.radius * i / 5)
-            alpha = 70 - i * 12
-            s = pygame.Surface((r * 2, r * 2), pygame.SRCALPHA)
-            pygame.draw.circle(s, (140, 0, 60, max(0, alpha)), (r, r), r)
-            surf.blit(s, (int(a.x) - r, int(a.y) - r))
-        pygame.draw.circle(surf, (8, 0, 2), (int(a.x), int(a.y)), int(a.radius * 0.28))
         for i in range(10):
             ang = t * 2.5 + i * math.pi / 5
             r1, r2 = a.radius * 0.32, a.radius * 0.95
@@ -823,35 +1179,9 @@ class LevelMap:
             pygame.draw.line(surf, (255, 40, 100, 150), (int(x1), int(y1)), (int(x2), int(y2)), 1)
 
     def _draw_repulsor(self, surf, a, t):
-        pulse = 0.5 + 0.5 * math.sin(t * 2)
-        s = pygame.Surface((int(a.radius * 2), int(a.radius * 2)), pygame.SRCALPHA)
-        pygame.draw.circle(s, (0, 180, 255, int(18 + pulse * 15)),
-                           (int(a.radius), int(a.radius)), int(a.radius))
-        surf.blit(s, (int(a.x - a.radius), int(a.y - a.radius)))
         pygame.draw.circle(surf, (0, 200, 255), (int(a.x), int(a.y)), int(a.radius), 1)
         pygame.draw.circle(surf, (120, 220, 255), (int(a.x), int(a.y)), 7)
 
-    def _draw_nebula_zone(self, surf, a, t):
-        for i in range(3):
-            r = int(a.radius * (1 - i * 0.25))
-            alpha = 12 + i * 8
-            s = pygame.Surface((r * 2, r * 2), pygame.SRCALPHA)
-            col = (60, 0, 140) if i % 2 == 0 else (0, 200, 160)
-            pygame.draw.circle(s, (*col, alpha), (r, r), r)
-            surf.blit(s, (int(a.x) - r, int(a.y) - r))
-        pygame.draw.circle(surf, (80, 0, 180), (int(a.x), int(a.y)), int(a.radius), 1)
-
-    def _draw_asteroid(self, surf, ast):
-        pts = []
-        for i in range(10):
-            ang = ast.angle + i * math.pi / 5
-            r = ast.radius * (0.65 + 0.35 * ((i * 7 + 3) % 5) / 4)
-            pts.append((int(ast.x + math.cos(ang) * r), int(ast.y + math.sin(ang) * r)))
-        if len(pts) >= 3:
-            pygame.draw.polygon(surf, ast.color, pts)
-            lighter = tuple(min(255, c + 50) for c in ast.color)
-            pygame.draw.polygon(surf, lighter, pts, 2)
-
     def _draw_crystal(self, surf, cs, t):
         a = cs.angle
         hw = cs.size * 0.4; hh = cs.size
@@ -862,62 +1192,76 @@ class LevelMap:
             (cs.x + math.cos(a - 1.57) * hh,   cs.y + math.sin(a - 1.57) * hh),
         ]
         pts_i = [(int(p[0]), int(p[1])) for p in pts]
-        s = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
+        s, box = self._fx_layer(cs.x, cs.y, cs.size + 2)
         if len(pts_i) >= 3:
             pygame.draw.polygon(s, (0, 220, 200, 160), pts_i)
             pygame.draw.polygon(s, (0, 255, 220, 220), pts_i, 2)
-        surf.blit(s, (0, 0))
+        surf.blit(s, box.topleft, area=box)
 
-    def _draw_pulse_ring(self, surf, pr, t):
-        alpha = int(180 * (1 - pr.radius / pr.max_radius))
+    def _draw_pulse_ring(self, surf, cx, cy, radius, max_radius, t):
+        alpha = int(180 * (1 - radius / max_radius))
         if alpha > 5:
-            s = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-            pygame.draw.circle(s, (*pr.color, alpha), (int(pr.cx), int(pr.cy)), int(pr.radius), 3)
-            surf.blit(s, (0, 0))
-
-    def _draw_lightning(self, surf, ln, t):
-        if ln.active:
-            s = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
+            s, box = self._fx_layer(int(cx), int(cy), int(radius) + 1)
+            pygame.draw.circle(s, (*self.cfg["accent"], alpha), (int(cx), int(cy)), int(radius), 3)
+            surf.blit(s, box.topleft, area=box)
+
+    def _draw_lightning(self, surf, lx, ly, lr, active, t):
+        if active:
+            # Bolts end up to 20 px past the node radius
+            s, box = self._fx_layer(int(lx), int(ly), int(lr) + 22)
             flicker = 0.5 + 0.5 * math.sin(t * 20)
             alpha = int(100 + flicker * 155)
-            pygame.draw.circle(s, (0, 240, 255, alpha), (int(ln.x), int(ln.y)), int(ln.radius))
-            pygame.draw.circle(s, (255, 255, 255, alpha), (int(ln.x), int(ln.y)), int(ln.radius), 3)
-            # Lightning bolts
-            for bolt in range(5):
-                ang = t * 5 + bolt * math.pi * 2 / 5
-                ex = ln.x + math.cos(ang) * ln.radius
-                ey = ln.y + math.sin(ang) * ln.radius
-                ex2 = ex + random.uniform(-20, 20)
-                ey2 = ey + random.uniform(-20, 20)
-                pygame.draw.line(s, (0, 255, 255, alpha), (int(ln.x), int(ln.y)), (int(ex2), int(ey2)), 2)
-            surf.blit(s, (0, 0))
+            pygame.draw.circle(s, (0, 240, 255, alpha), (int(lx), int(ly)), int(lr))
+            pygame.draw.circle(s, (255, 255, 255, alpha), (int(lx), int(ly)), int(lr), 3)
+            # Lightning bolts: one polyline out to each jittered tip and back to the centre
+            _cos = math.cos; _sin = math.sin; _uniform = random.uniform
+            c = (int(lx), int(ly)); pts = [c]
+            for base in BOLT_ANGLES:
+                ang = t * 5 + base
+                ex = lx + _cos(ang) * lr
+                ey = ly + _sin(ang) * lr
+                ex2 = ex + _uniform(-20, 20)
+                ey2 = ey + _uniform(-20, 20)
+                pts += ((int(ex2), int(ey2)), c)
+            pygame.draw.lines(s, (0, 255, 255, alpha), False, pts, 2)
+            surf.blit(s, box.topleft, area=box)
         else:
-            s = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-            pygame.draw.circle(s, (0, 80, 100, 60), (int(ln.x), int(ln.y)), int(ln.radius), 1)
-            surf.blit(s, (0, 0))
+            s, box = self._fx_layer(int(lx), int(ly), int(lr) + 1)
+            pygame.draw.circle(s, (0, 80, 100, 60), (int(lx), int(ly)), int(lr), 1)
+            surf.blit(s, box.topleft, area=box)
 
     def _draw_corridor(self, surf, gc, t):
         pulse = 0.3 + 0.2 * math.sin(t * 1.5 + gc.x * 0.01)
-        s = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-        # Draw corridor as oriented rect
-        hw, hh = gc.width / 2, gc.height / 2
-        cos_a, sin_a = math.cos(gc.direction), math.sin(gc.direction)
-        corners = [(-hw, -hh), (hw, -hh), (hw, hh), (-hw, hh)]
-        pts = [(int(gc.x + cx * cos_a - cy * sin_a), int(gc.y + cx * sin_a + cy * cos_a))
-               for cx, cy in corners]
-        pygame.draw.polygon(s, (255, 30, 60, int(pulse * 30)), pts)
-        pygame.draw.polygon(s, (255, 60, 90, 80), pts, 2)
-        surf.blit(s, (0, 0))
+        if gc.cached_surf is None:
+            # Draw corridor as oriented rect
+            hw, hh = gc.hw, gc.hh
+            cos_a, sin_a = gc.cos_d, gc.sin_d
+            corners = [(-hw, -hh), (hw, -hh), (hw, hh), (-hw, hh)]
+            pts = [(int(gc.x + cx * cos_a - cy * sin_a), int(gc.y + cx * sin_a + cy * cos_a))
+                   for cx, cy in corners]
+            box = pygame.Rect(pts[0], (0, 0)).unionall([pygame.Rect(p, (1, 1)) for p in pts])
+            box.inflate_ip(4, 4)
+            local = [(px - box.x, py - box.y) for px, py in pts]
+            fill = pygame.Surface(box.size, pygame.SRCALPHA)
+            outline = pygame.Surface(box.size, pygame.SRCALPHA)
+            pygame.draw.polygon(fill, (255, 30, 60), local)
+            pygame.draw.polygon(fill, (0, 0, 0, 0), local, 2)   # outline pixels replace the fill
+            pygame.draw.polygon(outline, (255, 60, 90, 80), local, 2)
+            gc.cached_surf = (fill.convert_alpha(), outline.convert_alpha(), box.topleft)
+        fill, outline, pos = gc.cached_surf
+        fill.set_alpha(int(pulse * 30))
+        surf.blit(fill, pos)
+        surf.blit(outline, pos)
 
     def _draw_boosts(self, surf, t):
         pulse = 0.5 + 0.5 * math.sin(t * 3)
         col = self.cfg["accent"]
+        glow = (*col, int(30 + pulse * 25))
+        surf.blits([(alpha_disk(pad.radius * 2, glow),
+                     (int(pad.x) - pad.radius * 2, int(pad.y) - pad.radius * 2))
+                    for pad in self.boost_pads if pad.active], doreturn=False)
         for pad in self.boost_pads:
             if pad.active:
-                s = pygame.Surface((pad.radius * 5, pad.radius * 5), pygame.SRCALPHA)
-                pygame.draw.circle(s, (*col, int(30 + pulse * 25)),
-                                   (pad.radius * 2, pad.radius * 2), pad.radius * 2)
-                surf.blit(s, (int(pad.x) - pad.radius * 2, int(pad.y) - pad.radius * 2))
                 pygame.draw.circle(surf, col, (int(pad.x), int(pad.y)), pad.radius, 2)
                 # Inner cross
                 r = pad.radius // 2
@@ -929,6 +1273,8 @@ class LevelMap:
 
 # ─── CAR ──────────────────────────────────────────────────────────────────────
 class Car:
+    MASS = 1.0
+
     def __init__(self, x, y, is_player=True, level_cfg=None):
         self.x = float(x); self.y = float(y)
         self.vx = 0.0; self.vy = 0.0
@@ -937,79 +1283,59 @@ class Car:
         self.boost = BOOST_MAX
         self.score = 0
         self.boosting = False
-        self.trail: List[Tuple] = []
+        self.trail: deque = deque(maxlen=22)
         self.invincible = 0.0
         cfg = level_cfg or LEVELS[0]
         self.color  = cfg["accent"]  if is_player else cfg["accent2"]
         self.color2 = tuple(max(0, c - 80) for c in self.color)
+        self._rect = pygame.Rect(0, 0, CAR_W, CAR_H)
 
     @property
     def rect(self):
-        return pygame.Rect(self.x - CAR_W//2, self.y - CAR_H//2, CAR_W, CAR_H)
+        self._rect.topleft = (self.x - CAR_W//2, self.y - CAR_H//2)
+        return self._rect
 
     def apply_input(self, left, right, forward, back, boost_key, dt):
-        rot_spd = 220 * dt
-        if left:  self.angle -= rot_spd * (math.pi / 180)
-        if right: self.angle += rot_spd * (math.pi / 180)
-        accel = 400
-        if forward:
-            self.vx += math.cos(self.angle) * accel * dt
-            self.vy += math.sin(self.angle) * accel * dt
-        if back:
-            self.vx -= math.cos(self.angle) * accel * 0.5 * dt
-            self.vy -= math.sin(self.angle) * accel * 0.5 * dt
-        self.boosting = boost_key and self.boost > 5 and forward
-        if self.boosting:
-            self.vx += math.cos(self.angle) * BOOST_SPEED * dt
-            self.vy += math.sin(self.angle) * BOOST_SPEED * dt
-            self.boost -= BOOST_COST * dt
-        else:
-            self.boost = min(BOOST_MAX, self.boost + BOOST_RECHARGE * dt)
-        spd = v2_len((self.vx, self.vy))
-        max_s = BOOST_SPEED if self.boosting else MAX_SPEED
-        if spd > max_s:
-            scale = max_s / spd
-            self.vx *= scale; self.vy *= scale
-        drag = 0.992 if not forward and not back else 0.999
-        self.vx *= drag; self.vy *= drag
+        self.vx, self.vy, self.angle, self.boost, self.boosting = _drive(
+            self.vx, self.vy, self.angle, self.boost,
+            bool(left), bool(right), bool(forward), bool(back), bool(boost_key), dt)
 
     def update(self, dt, level_map: LevelMap):
-        self.vx, self.vy = level_map.apply_gravity(self.x, self.y, self.vx, self.vy, dt=dt)
         self.x += self.vx * dt; self.y += self.vy * dt
         self.trail.append((self.x, self.y))
-        if len(self.trail) > 22: self.trail.pop(0)
-        pad = 30
-        if self.x < pad:          self.x = pad;            self.vx = abs(self.vx) * 0.6
-        if self.x > SCREEN_W - pad: self.x = SCREEN_W - pad; self.vx = -abs(self.vx) * 0.6
-        if self.y < pad:           self.y = pad;             self.vy = abs(self.vy) * 0.6
-        if self.y > SCREEN_H - pad: self.y = SCREEN_H - pad; self.vy = -abs(self.vy) * 0.6
-        for ast in level_map.asteroids:
-            dx = self.x - ast.x; dy = self.y - ast.y
-            d = math.sqrt(dx**2 + dy**2)
-            min_d = ast.radius + max(CAR_W, CAR_H) // 2
-            if d < min_d and d > 0.1:
+        # Clamp to the arena; on contact bounce away from the wall at 60% speed
+        self.x, self.y, self.vx, self.vy = _wall_bounce(self.x, self.y, self.vx, self.vy, 30.0, 0.6)
+        for ax, ay, ar in level_map.query(self.x, self.y, max(CAR_W, CAR_H) // 2):
+            dx = self.x - ax; dy = self.y - ay
+            d2 = dx * dx + dy * dy
+            min_d = ar + max(CAR_W, CAR_H) // 2
+            if d2 < min_d * min_d and d2 > 0.01:
+                d = math.sqrt(d2)
                 nx, ny = dx / d, dy / d
                 self.vx += nx * 220; self.vy += ny * 220
         if self.invincible > 0: self.invincible -= dt
-        for bp in level_map.boost_pads:
-            if bp.active:
-                dx = self.x - bp.x; dy = self.y - bp.y
-                if math.sqrt(dx**2 + dy**2) < bp.radius + 16:
-                    self.boost = min(BOOST_MAX, self.boost + 45)
-                    bp.active = False; bp.cooldown = 5.0
+        pads = level_map.boost_pads
+        hit = None
+        for i in level_map.active_pads:
+            bp = pads[i]
+            dx = self.x - bp.x; dy = self.y - bp.y
+            reach = bp.radius + 16
+            if dx * dx + dy * dy < reach * reach:
+                hit = i
+                break   # at most one pickup per car per frame
+        if hit is not None:   # take_pad shrinks active_pads, so not while iterating it
+            self.boost = min(BOOST_MAX, self.boost + 45)
+            level_map.take_pad(hit)
 
     def draw(self, surf, particles: ParticleSystem):
-        for i, (tx, ty) in enumerate(self.trail):
-            alpha = i / max(1, len(self.trail))
-            r = int(self.color[0] * alpha * 0.5)
-            g = int(self.color[1] * alpha * 0.5)
-            b = int(self.color[2] * alpha * 0.5)
-            pygame.draw.circle(surf, (r, g, b), (int(tx), int(ty)), max(1, int(3 * alpha)))
+        sprites = trail_sprites(self.color, len(self.trail), (0.5, 0.5, 0.5), 3)
+        surf.blits([(spr, (int(tx) - r, int(ty) - r))
+                    for (tx, ty), (spr, r) in zip(self.trail, sprites)], doreturn=False)
         if self.boosting:
             bx = self.x - math.cos(self.angle) * 20
             by = self.y - math.sin(self.angle) * 20
-            particles.emit(bx, by, -math.cos(self.angle)*80, -math.sin(self.angle)*80,
-                           (255, 180, 0), count=3, spread=30, life=0.3, size=4)
+            particles.queue(bx, by, -math.cos(self.angle)*80, -math.sin(self.angle)*80,
+                            (255, 180, 0), count=3, spread=30, life=0.3, size=4)
         cos_a, sin_a = math.cos(self.angle), math.sin(self.angle)
         def rot(px, py):
             return (int(self.x + px*cos_a - py*sin_a), int(self.y + px*sin_a + py*cos_a))
@@ -1019,68 +1345,63 @@ class Car:
         cock = [rot(0, -CAR_H//4), rot(CAR_W//3, -4), rot(CAR_W//3, 4), rot(0, CAR_H//4)]
         pygame.draw.polygon(surf, (200, 240, 255), cock)
         eg_x, eg_y = rot(-CAR_W//2, 0)
-        s = pygame.Surface((20, 20), pygame.SRCALPHA)
-        pygame.draw.circle(s, (255, 180, 0, 160 if self.boosting else 60), (10, 10), 8)
-        surf.blit(s, (eg_x - 10, eg_y - 10))
+        surf.blit(alpha_disk(8, (255, 180, 0, 160 if self.boosting else 60)), (eg_x - 8, eg_y - 8))
 
 
 # ─── BALL ─────────────────────────────────────────────────────────────────────
 class Ball:
+    MASS = 0.7
+
     def __init__(self):
         self.reset()
 
     def reset(self):
-        self.x = float(SCREEN_W // 2); self.y = float(SCREEN_H // 2)
+        self.x = float(CX); self.y = float(CY)
         self.vx = random.uniform(-120, 120); self.vy = random.uniform(-90, 90)
-        self.trail: List[Tuple] = []
+        self.trail: deque = deque(maxlen=16)
         self.spin = 0.0
 
     def update(self, dt, level_map: LevelMap):
-        self.vx, self.vy = level_map.apply_gravity(self.x, self.y, self.vx, self.vy, mass=0.7, dt=dt)
         self.x += self.vx * dt; self.y += self.vy * dt
         self.spin += 0.05
         self.trail.append((self.x, self.y))
-        if len(self.trail) > 16: self.trail.pop(0)
-        if self.x < BALL_RADIUS:             self.x = BALL_RADIUS;             self.vx = abs(self.vx)*0.9
-        if self.x > SCREEN_W - BALL_RADIUS:  self.x = SCREEN_W - BALL_RADIUS;  self.vx = -abs(self.vx)*0.9
-        if self.y < BALL_RADIUS:             self.y = BALL_RADIUS;             self.vy = abs(self.vy)*0.9
-        if self.y > SCREEN_H - BALL_RADIUS:  self.y = SCREEN_H - BALL_RADIUS;  self.vy = -abs(self.vy)*0.9
-        for ast in level_map.asteroids:
-            dx = self.x - ast.x; dy = self.y - ast.y
-            d = math.sqrt(dx**2 + dy**2)
-            if d < BALL_RADIUS + ast.radius and d > 0.1:
+        self.x, self.y, self.vx, self.vy = _wall_bounce(self.x, self.y, self.vx, self.vy,
+                                                        float(BALL_RADIUS), 0.9)
+        for ax, ay, ar in level_map.query(self.x, self.y, BALL_RADIUS):
+            dx = self.x - ax; dy = self.y - ay
+            d2 = dx*dx + dy*dy
+            if d2 < (BALL_RADIUS + ar)**2 and d2 > 0.01:
+                d = math.sqrt(d2)
                 nx, ny = dx/d, dy/d
-                spd = v2_len((self.vx, self.vy))
+                spd = v2_len(self.vx, self.vy)
                 self.vx = nx * max(spd, 160); self.vy = ny * max(spd, 160)
-                self.x = ast.x + nx * (BALL_RADIUS + ast.radius + 2)
-                self.y = ast.y + ny * (BALL_RADIUS + ast.radius + 2)
-        spd = v2_len((self.vx, self.vy))
-        if spd > 750: self.vx = self.vx/spd*750; self.vy = self.vy/spd*750
+                self.x = ax + nx * (BALL_RADIUS + ar + 2)
+                self.y = ay + ny * (BALL_RADIUS + ar + 2)
+        spd2 = self.vx*self.vx + self.vy*self.vy
+        if spd2 > 750*750:
+            k = 750 / math.sqrt(spd2); self.vx *= k; self.vy *= k
 
     def car_hit(self, car: Car, particles: ParticleSystem):
-        dx = self.x - car.x; dy = self.y - car.y
-        d = math.sqrt(dx**2 + dy**2)
-        min_d = BALL_RADIUS + max(CAR_W, CAR_H) // 2
-        if d < min_d and d > 0.1:
-            nx, ny = dx/d, dy/d
-            car_spd = v2_len((car.vx, car.vy))
-            impact = max(car_spd * 0.8, 260) + (200 if car.boosting else 0)
-            self.vx = nx*impact + car.vx*0.3; self.vy = ny*impact + car.vy*0.3
-            car.vx -= nx*80; car.vy -= ny*80
-            self.x = car.x + nx*(min_d+2); self.y = car.y + ny*(min_d+2)
+        hit, bx, by, bvx, bvy, cvx, cvy = _ball_car_hit(
+            self.x, self.y, self.vx, self.vy, car.x, car.y, car.vx, car.vy, bool(car.boosting))
+        if hit:
+            self.x, self.y, self.vx, self.vy = bx, by, bvx, bvy
+            car.vx, car.vy = cvx, cvy
             particles.emit(self.x, self.y, 0, 0, (255,180,0), count=12, spread=130, life=0.4, size=4)
             return True
         return False
 
+    def car_hits(self, cars, particles: ParticleSystem):
+        """car_hit against each car in turn; later cars see the deflected ball."""
+        for car in cars:
+            self.car_hit(car, particles)
+
     def draw(self, surf, level_cfg: dict):
         col = level_cfg["accent"]
-        for i, (tx, ty) in enumerate(self.trail):
-            alpha = i / max(1, len(self.trail))
-            r = int(col[0]*alpha); g = int(col[1]*alpha*0.7); b = int(col[2]*alpha*0.5)
-            pygame.draw.circle(surf, (r,g,b), (int(tx),int(ty)), max(1, int(BALL_RADIUS*0.4*alpha)))
-        gs = pygame.Surface((BALL_RADIUS*6, BALL_RADIUS*6), pygame.SRCALPHA)
-        pygame.draw.circle(gs, (*col, 45), (BALL_RADIUS*3, BALL_RADIUS*3), BALL_RADIUS*3)
-        surf.blit(gs, (int(self.x)-BALL_RADIUS*3, int(self.y)-BALL_RADIUS*3))
+        sprites = trail_sprites(col, len(self.trail), (1.0, 0.7, 0.5), BALL_RADIUS*0.4)
+        surf.blits([(spr, (int(tx)-r, int(ty)-r))
+                    for (tx, ty), (spr, r) in zip(self.trail, sprites)], doreturn=False)
+        surf.blit(alpha_disk(BALL_RADIUS*3, (*col, 45)), (int(self.x)-BALL_RADIUS*3, int(self.y)-BALL_RADIUS*3))
         pygame.draw.circle(surf, col, (int(self.x), int(self.y)), BALL_RADIUS)
         for i in range(3):
             ang = self.spin + i * math.pi*2/3
@@ -1107,6 +1428,9 @@ class AIBrain:
             "retreat":     {"defend_goal":0.5,"chase_ball":0.4,"boost_hunt":0.1},
             "boost_hunt":  {"chase_ball":0.7,"attack_goal":0.3},
         }
+        # Per-state (next states, cumulative probabilities) for choose_state
+        self._q = {state: (tuple(w), tuple(c / sum(w.values()) for c in accumulate(w.values())))
+                   for state, w in self.q_weights.items()}
         self.goals_conceded = 0; self.goals_scored = 0
         self.reaction_delay = [0.5,0.25,0.1,0.0][diff.value]
         self.aim_noise      = [30.0,15.0,6.0,1.0][diff.value]
@@ -1121,55 +1445,51 @@ class AIBrain:
             self.reaction_delay = min(0.6, self.reaction_delay + 0.03)
 
     def predict_ball(self, ball: Ball, steps=20, dt=0.05):
-        px,py = ball.x,ball.y; pvx,pvy = ball.vx,ball.vy
-        for _ in range(steps):
-            px += pvx*dt; py += pvy*dt
-        return px,py
+        # Straight-line extrapolation; no forces are modelled
+        T = steps*dt
+        return ball.x + ball.vx*T, ball.y + ball.vy*T
 
     def choose_state(self, car: Car, ball: Ball, level_map: LevelMap):
         goal_x = SCREEN_W - GOAL_W//2
         ball_to_goal = abs(ball.x - goal_x)
-        car_to_ball  = math.sqrt((car.x-ball.x)**2+(car.y-ball.y)**2)
+        car_to_ball2 = (car.x-ball.x)**2+(car.y-ball.y)**2
         ball_danger  = ball.x > SCREEN_W*0.65 and ball_to_goal < 250
         boost_low    = car.boost < 30
-        boost_near   = any(math.sqrt((car.x-p.x)**2+(car.y-p.y)**2)<200
-                           for p in level_map.boost_pads if p.active)
+        pads = level_map.boost_pads
+        boost_near   = any((car.x-pads[i].x)**2+(car.y-pads[i].y)**2 < 200*200
+                           for i in level_map.active_pads)
         if ball_danger:                             return "defend_goal"
         if boost_low and boost_near:                return "boost_hunt"
-        if car_to_ball < 150 and ball.x < SCREEN_W*0.5: return "attack_goal"
-        weights = self.q_weights.get(self.state, self.q_weights["idle"])
-        candidates = list(weights.keys())
-        probs = np.array(list(weights.values())); probs /= probs.sum()
-        return np.random.choice(candidates, p=probs)
+        if car_to_ball2 < 150*150 and ball.x < SCREEN_W*0.5: return "attack_goal"
+        states, cum = self._q.get(self.state, self._q["idle"])
+        return states[min(bisect_right(cum, random.random()), len(states) - 1)]
 
     def get_controls(self, car: Car, ball: Ball, level_map: LevelMap, dt: float):
+        _uniform = random.uniform
         self.think_timer -= dt; self.state_timer += dt
         if self.think_timer <= 0:
             self.state = self.choose_state(car, ball, level_map)
-            self.think_timer = self.reaction_delay + random.uniform(-0.05,0.05)
+            self.think_timer = self.reaction_delay + _uniform(-0.05,0.05)
         pred_bx,pred_by = self.predict_ball(ball)
         ai_goal_x = SCREEN_W - GOAL_W - 30
         player_goal_x = GOAL_W + 30
-        if   self.state == "defend_goal":  tx = lerp(pred_bx,ai_goal_x,0.6); ty = lerp(pred_by,SCREEN_H//2,0.3)
+        if   self.state == "defend_goal":  tx = lerp(pred_bx,ai_goal_x,0.6); ty = lerp(pred_by,CY,0.3)
         elif self.state == "attack_goal":  tx = pred_bx+(player_goal_x-pred_bx)*0.3; ty = pred_by
         elif self.state == "boost_hunt":
-            nearest = None; nearest_d = 9999
-            for pad in level_map.boost_pads:
-                if pad.active:
-                    d = math.sqrt((car.x-pad.x)**2+(car.y-pad.y)**2)
-                    if d < nearest_d: nearest_d=d; nearest=pad
+            nearest = None; nearest_d2 = 9999**2
+            for i in level_map.active_pads:
+                pad = level_map.boost_pads[i]
+                d2 = (car.x-pad.x)**2+(car.y-pad.y)**2
+                if d2 < nearest_d2: nearest_d2=d2; nearest=pad
             tx,ty = (nearest.x,nearest.y) if nearest else (pred_bx,pred_by)
-        elif self.state == "retreat":  tx,ty = ai_goal_x,SCREEN_H//2
+        elif self.state == "retreat":  tx,ty = ai_goal_x,CY
         else:                          tx,ty = pred_bx,pred_by
-        tx += random.uniform(-self.aim_noise,self.aim_noise)
-        ty += random.uniform(-self.aim_noise,self.aim_noise)
-        dx = tx-car.x; dy = ty-car.y
-        ta = math.atan2(dy,dx)
-        ad = (ta-car.angle+math.pi)%(math.pi*2)-math.pi
-        left  = ad < -0.08; right = ad > 0.08
-        dist  = math.sqrt(dx**2+dy**2)
-        forward = dist > 40; back = False
-        use_boost = car.boost>40 and dist>150 and self.state in ["attack_goal","defend_goal"]
+        noise = self.aim_noise
+        tx += _uniform(-noise,noise)
+        ty += _uniform(-noise,noise)
+        left, right, dist2 = _steer(tx, ty, car.x, car.y, car.angle)
+        forward = dist2 > 40*40; back = False
+        use_boost = car.boost>40 and dist2>150*150 and self.state in ("attack_goal","defend_goal")
         return left,right,forward,back,use_boost
 
 
@@ -1181,16 +1501,15 @@ class GoalZone:
         self.y     = (SCREEN_H-GOAL_H)//2
         self.rect  = pygame.Rect(self.x,self.y,GOAL_W,GOAL_H)
         self.color = level_cfg["accent"] if side=="left" else level_cfg["accent2"]
-
-    def check_goal(self, ball: Ball) -> bool:
-        return self.rect.collidepoint(int(ball.x),int(ball.y))
+        # Glow drawn once at full alpha and faded per frame with set_alpha
+        self.glow = pygame.Surface((GOAL_W*5, GOAL_H+40), pygame.SRCALPHA)
+        pygame.draw.rect(self.glow, self.color, (0,20,GOAL_W*5,GOAL_H))
+        self.glow = self.glow.convert_alpha()
 
     def draw(self, surf, t: float):
         pulse = 0.5 + 0.5*math.sin(t*2)
-        gs = pygame.Surface((GOAL_W*5, GOAL_H+40), pygame.SRCALPHA)
-        alpha = int(20+pulse*15)
-        pygame.draw.rect(gs, (*self.color, alpha), (0,20,GOAL_W*5,GOAL_H))
-        surf.blit(gs, (self.x-(GOAL_W*4 if self.side=="right" else 0), self.y-20))
+        self.glow.set_alpha(int(20+pulse*15))
+        surf.blit(self.glow, (self.x-(GOAL_W*4 if self.side=="right" else 0), self.y-20))
         pygame.draw.rect(surf, self.color, self.rect, 3)
         for i in range(1,6):
             y = self.y + i*GOAL_H//6
@@ -1198,6 +1517,18 @@ class GoalZone:
 
 
 # ─── HUD ──────────────────────────────────────────────────────────────────────
+@lru_cache(maxsize=512)
+def render_text(font, text: str, color):
+    """font.render(text, True, color), cached — HUD strings repeat frame to frame."""
+    return font.render(text, True, color).convert_alpha()
+
+@lru_cache(maxsize=8)
+def _hud_bar(accent):
+    bar = pygame.Surface((SCREEN_W, 62), pygame.SRCALPHA)
+    pygame.draw.rect(bar, (5,5,15,210), (0,0,SCREEN_W,62))
+    pygame.draw.line(bar, (*accent, 80), (0,61),(SCREEN_W,61), 1)
+    return bar.convert_alpha()
+
 def draw_hud(surf, fonts, player: Car, ai: Car, level_map: LevelMap,
              time_left: float, ai_state: str, particles: ParticleSystem,
              msg: str, msg_timer: float, combo: int):
@@ -1207,32 +1538,29 @@ def draw_hud(surf, fonts, player: Car, ai: Car, level_map: LevelMap,
     accent2 = cfg["accent2"]
 
     # ── TOP BAR ──
-    bar = pygame.Surface((SCREEN_W, 62), pygame.SRCALPHA)
-    pygame.draw.rect(bar, (5,5,15,210), (0,0,SCREEN_W,62))
-    pygame.draw.line(bar, (*accent, 80), (0,61),(SCREEN_W,61), 1)
-    surf.blit(bar, (0,0))
+    surf.blit(_hud_bar(accent), (0,0))
 
     # Level name top-center
-    lvl_txt = font_xs.render(f"◈  {cfg['name']}  ◈", True, accent)
-    surf.blit(lvl_txt, (SCREEN_W//2 - lvl_txt.get_width()//2, 4))
+    lvl_txt = render_text(font_xs, f"◈  {cfg['name']}  ◈", accent)
+    surf.blit(lvl_txt, (CX - lvl_txt.get_width()//2, 4))
 
     # Scores
-    p_txt = font_big.render(str(player.score), True, accent)
-    a_txt = font_big.render(str(ai.score),     True, accent2)
-    surf.blit(p_txt, (SCREEN_W//2 - 80 - p_txt.get_width(), 14))
-    surf.blit(a_txt, (SCREEN_W//2 + 80, 14))
+    p_txt = render_text(font_big, str(player.score), accent)
+    a_txt = render_text(font_big, str(ai.score),     accent2)
+    surf.blit(p_txt, (CX - 80 - p_txt.get_width(), 14))
+    surf.blit(a_txt, (CX + 80, 14))
 
     # Divider & timer
-    pygame.draw.line(surf, (200,200,255), (SCREEN_W//2,12),(SCREEN_W//2,58), 2)
+    pygame.draw.line(surf, (200,200,255), (CX,12),(CX,58), 2)
     t_col = (255,60,60) if time_left < 30 else (220,220,255)
     mins = int(time_left)//60; secs = int(time_left)%60
-    t_txt = font_med.render(f"{mins}:{secs:02d}", True, t_col)
-    surf.blit(t_txt, (SCREEN_W//2 - t_txt.get_width()//2, 16))
+    t_txt = render_text(font_med, f"{mins}:{secs:02d}", t_col)
+    surf.blit(t_txt, (CX - t_txt.get_width()//2, 16))
 
     # Combo
     if combo > 1:
-        combo_txt = font_sm.render(f"COMBO x{combo}!", True, (255,220,0))
-        surf.blit(combo_txt, (SCREEN_W//2 - combo_txt.get_width()//2, 64))
+        combo_txt = render_text(font_sm, f"COMBO x{combo}!", (255,220,0))
+        surf.blit(combo_txt, (CX - combo_txt.get_width()//2, 64))
 
     # ── PLAYER BOOST BAR (bottom-left) ──
     _draw_boost(surf, fonts, 20, SCREEN_H-52, player.boost, "YOU", accent)
@@ -1241,64 +1569,71 @@ def draw_hud(surf, fonts, player: Car, ai: Car, level_map: LevelMap,
     _draw_boost(surf, fonts, SCREEN_W-240, SCREEN_H-52, ai.boost, "AI", accent2)
 
     # ── AI STATE (top-right) ──
-    ai_s = font_xs.render(f"AI▶ {ai_state.upper()}", True, (100,110,140))
+    ai_s = render_text(font_xs, f"AI▶ {ai_state.upper()}", (100,110,140))
     surf.blit(ai_s, (SCREEN_W - ai_s.get_width() - 14, 66))
 
     # ── HAZARD LEGEND (top-left) ──
     haz = cfg["description"]
-    hz_txt = font_xs.render(haz, True, (80,90,120))
+    hz_txt = render_text(font_xs, haz, (80,90,120))
     surf.blit(hz_txt, (14, 66))
 
     # ── AI MESSAGE (bottom center) ──
     if msg and msg_timer > 0:
         alpha = min(255, int(msg_timer * 255))
-        msg_s = font_sm.render(f"[ {msg} ]", True, (255,255,200))
-        mx = SCREEN_W//2 - msg_s.get_width()//2
+        msg_s = render_text(font_sm, f"[ {msg} ]", (255,255,200))
+        mx = CX - msg_s.get_width()//2
         pygame.draw.rect(surf, (5,5,15), (mx-8, SCREEN_H-84, msg_s.get_width()+16, 26))
         surf.blit(msg_s, (mx, SCREEN_H-84))
 
     # ── CONTROLS HINT ──
-    ctrl = font_xs.render("WASD/↑↓←→  SPACE=BOOST  N=NEXT MAP  R=RESTART  ESC=QUIT", True, (55,60,80))
-    surf.blit(ctrl, (SCREEN_W//2 - ctrl.get_width()//2, SCREEN_H-22))
+    ctrl = render_text(font_xs, "WASD/↑↓←→  SPACE=BOOST  N=NEXT MAP  R=RESTART  ESC=QUIT", (55,60,80))
+    surf.blit(ctrl, (CX - ctrl.get_width()//2, SCREEN_H-22))
 
 def _draw_boost(surf, fonts, x, y, boost, label, color):
     font_sm = fonts[2]; font_xs = fonts[3]
     pygame.draw.rect(surf, (8,8,18), (x,y-18,220,46))
-    lbl = font_xs.render(label, True, color)
+    lbl = render_text(font_xs, label, color)
     surf.blit(lbl, (x+4, y-16))
     pygame.draw.rect(surf, (25,25,40), (x,y,200,14), border_radius=4)
     fw = int(200 * boost / BOOST_MAX)
     bc = color if boost>30 else (255,60,60)
     if fw>0: pygame.draw.rect(surf, bc, (x,y,fw,14), border_radius=4)
     pygame.draw.rect(surf, color, (x,y,200,14), 1, border_radius=4)
-    pct = font_xs.render(f"{int(boost)}%", True, (200,200,220))
+    pct = render_text(font_xs, f"{int(boost)}%", (200,200,220))
     surf.blit(pct, (x+205, y))
 
 
 # ─── LEVEL SELECT SCREEN ──────────────────────────────────────────────────────
+def _menu_stars():
+    rng = random.Random(99)
+    rows = [(rng.randint(0,SCREEN_W), rng.randint(0,SCREEN_H), rng.randint(60,180)) for _ in range(200)]
+    a = np.array(rows, dtype=np.int32)
+    return a[:,0].copy(), a[:,1].copy(), a[:,2].copy()
+
+# Level-select starfield: fixed layout, only the twinkle is computed per frame
+MENU_STAR_X, MENU_STAR_Y, MENU_STAR_BASE = _menu_stars()
+MENU_STAR_R = np.ones_like(MENU_STAR_X)
+
 def draw_level_select(surf, fonts, selected: int, t: float, best_scores: dict):
     font_big, font_med, font_sm, font_xs = fonts
     surf.fill((3,4,14))
 
     # Starfield
-    rng = random.Random(99)
-    for _ in range(200):
-        sx,sy = rng.randint(0,SCREEN_W),rng.randint(0,SCREEN_H)
-        sb = rng.randint(60,180)
-        pulse = 0.5+0.5*math.sin(t*2+sx*0.1)
-        sb2 = int(sb*pulse)
-        pygame.draw.circle(surf,(sb2,sb2,sb2+30),(sx,sy),1)
+    sb2 = (MENU_STAR_BASE*(0.5+0.5*np.sin(t*2+MENU_STAR_X*0.1))).astype(np.int32)
+    pixels = pygame.surfarray.pixels3d(surf)
+    splat(pixels, None, MENU_STAR_X, MENU_STAR_Y, MENU_STAR_R, np.stack([sb2,sb2,sb2+30], axis=1))
+    del pixels
 
     # Title
     title = font_big.render("COSMIC ROCKET LEAGUE", True, (0,220,255))
     sub   = font_sm.render("SELECT YOUR ARENA — USE ← → THEN ENTER", True, (80,90,140))
-    surf.blit(title, (SCREEN_W//2-title.get_width()//2, 32))
-    surf.blit(sub,   (SCREEN_W//2-sub.get_width()//2,  90))
+    surf.blit(title, (CX-title.get_width()//2, 32))
+    surf.blit(sub,   (CX-sub.get_width()//2,  90))
 
     # Level cards
     card_w = 210; card_h = 300; spacing = 225
-    total_w = len(LEVELS)*spacing - (spacing - card_w)
-    start_x = SCREEN_W//2 - total_w//2
+    total_w = N_LEVELS*spacing - (spacing - card_w)
+    start_x = CX - total_w//2
 
     for i, lvl in enumerate(LEVELS):
         cx = start_x + i*spacing
@@ -1345,8 +1680,6 @@ def draw_level_select(surf, fonts, selected: int, t: float, best_scores: dict):
             arrow = font_med.render("▼ PRESS ENTER ▼", True, col)
             surf.blit(arrow, (cx + card_w//2 - arrow.get_width()//2, cy+card_h+12))
 
-    pygame.display.flip()
-
 
 # ─── AI MESSAGES ──────────────────────────────────────────────────────────────
 AI_MSGS = {
@@ -1385,37 +1718,79 @@ def ai_say(category: str) -> str:
     return random.choice(msgs)
 
 
+# ─── KEY BINDINGS ─────────────────────────────────────────────────────────────
+_SEL_LEFT_KEYS  = (pygame.K_LEFT, pygame.K_a)
+_SEL_RIGHT_KEYS = (pygame.K_RIGHT, pygame.K_d)
+_SEL_GO_KEYS    = (pygame.K_RETURN, pygame.K_SPACE)
+_K_ESCAPE, _K_SPACE, _K_N, _K_R = (pygame.K_ESCAPE, pygame.K_SPACE,
+                                   pygame.K_n, pygame.K_r)
+_HANDLED_EVENTS = (pygame.QUIT, pygame.KEYDOWN)
+EVENT_PERIOD_MS = 1000 // FPS   # never drain the event queue faster than this
+
 # ─── GAME ─────────────────────────────────────────────────────────────────────
 class Game:
     MATCH_TIME = 120.0
+    NOISE_BATCH = 1024
 
     def __init__(self):
         pygame.init()
         pygame.display.set_caption("🚀 COSMIC ROCKET LEAGUE — 5 Unique Arenas")
-        self.screen = pygame.display.set_mode((SCREEN_W, SCREEN_H))
+        try:
+            self.screen = pygame.display.set_mode((SCREEN_W, SCREEN_H),
+                                                  pygame.SCALED | pygame.DOUBLEBUF, vsync=1)
+        except pygame.error:   # no accelerated renderer available: plain software window
+            self.screen = pygame.display.set_mode((SCREEN_W, SCREEN_H))
         self.clock  = pygame.time.Clock()
+        # Only quit and key presses are handled; keep everything else
+        # (mouse motion, window events) out of the SDL queue entirely
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(_HANDLED_EVENTS)
+        self._last_event_pump = 0
+        self._dirty = True   # forces a redraw of otherwise static screens
+        # Opaque flash layer, tinted per goal and faded with surface alpha
+        self._flash_surf = pygame.Surface((SCREEN_W, SCREEN_H)).convert()
         self.fonts  = (
             pygame.font.SysFont("consolas", 46, bold=True),
             pygame.font.SysFont("consolas", 30, bold=True),
             pygame.font.SysFont("consolas", 20, bold=True),
             pygame.font.SysFont("consolas", 15),
         )
-        self.particles = ParticleSystem()
-        self.best_scores = {i: 0 for i in range(len(LEVELS))}
+        gt = self.fonts[1].render("GOAL!  PRESS SPACE", True, (255,255,255)).convert_alpha()
+        self._goal_text = (gt, (CX - gt.get_width()//2, CY - 20))
+        self.particles = ParticleSystem(MAX_PARTICLES)
+        self.best_scores = {i: 0 for i in range(N_LEVELS)}
         self.state     = "select"   # select | playing | goal_flash | gameover
         self.sel_level = 0
         self.t         = 0.0
+        # Scratch rows for [player, ai, ball], reused by every gravity pass
+        self._grav_pos  = np.empty((3, 2))
+        self._grav_vel  = np.empty((3, 2))
+        self._grav_mass = np.array([Car.MASS, Car.MASS, Ball.MASS])
+        self._ball_pt = pygame.Rect(0, 0, 1, 1)   # ball centre, for goal-mouth tests
+        # Gameplay jitter comes from a ring of pre-drawn uniform(-1, 1) samples
+        self._rng = np.random.default_rng()
+        self._noise_buf = self._rng.uniform(-1.0, 1.0, self.NOISE_BATCH).tolist()
+        self._noise_i = 0
+        # left, right, forward, back, boost — each as (primary, alternate)
+        self._K = (pygame.K_a, pygame.K_LEFT, pygame.K_d, pygame.K_RIGHT,
+                   pygame.K_w, pygame.K_UP, pygame.K_s, pygame.K_DOWN,
+                   pygame.K_SPACE, pygame.K_LSHIFT)
         self._init_game(0)
+        # Compile (or load from cache) the gravity kernel before the first frame;
+        # the other kernels carry signatures and are compiled at import
+        self._apply_gravity(0.0)
 
     def _init_game(self, level_id: int):
         self.level_id  = level_id
         self.level_map = LevelMap(level_id)
         cfg = self.level_map.cfg
-        self.player = Car(180, SCREEN_H//2, is_player=True,  level_cfg=cfg)
-        self.ai_car = Car(SCREEN_W-180, SCREEN_H//2, is_player=False, level_cfg=cfg)
+        self.player = Car(180, CY, is_player=True,  level_cfg=cfg)
+        self.ai_car = Car(SCREEN_W-180, CY, is_player=False, level_cfg=cfg)
         self.ball   = Ball()
         self.goal_l = GoalZone("left",  cfg)
         self.goal_r = GoalZone("right", cfg)
+        self._goal_rects = [self.goal_l.rect, self.goal_r.rect]
+        self._cars = (self.player, self.ai_car)
         self.ai_brain = AIBrain(AIDifficulty.MEDIUM)
         self.ai_state = "idle"
         self.time_left = self.MATCH_TIME
@@ -1427,109 +1802,169 @@ class Game:
         self.msg_timer = 0.0
         self.low_time_warned = False
         self.winner    = None
+        self._bg_cache = self.level_map.terrain.static_surf   # opaque, covers the screen
+        self._field_overlay = self._build_field_overlay(cfg["accent"])
+        self._acc = 0.0
+        self._snap_prev()
+
+    @staticmethod
+    def _build_field_overlay(accent):
+        """Centre line and kick-off circle, drawn once per level."""
+        field_s = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA).convert_alpha()
+        field_s.fill((0, 0, 0, 0))
+        pygame.draw.line(field_s, (*accent, 40), (CX, 62), (CX, SCREEN_H), 1)
+        pygame.draw.circle(field_s, (*accent, 30), (CX, CY), 90, 1)
+        pygame.draw.circle(field_s, (*accent, 50), (CX, CY), 5)
+        return field_s
 
     def reset_positions(self):
-        self.player.x = 180;        self.player.y = SCREEN_H//2
+        self.player.x = 180;        self.player.y = CY
         self.player.vx=0;           self.player.vy=0
-        self.ai_car.x = SCREEN_W-180; self.ai_car.y = SCREEN_H//2
+        self.ai_car.x = SCREEN_W-180; self.ai_car.y = CY
         self.ai_car.vx=0;           self.ai_car.vy=0
         self.ball.reset()
         self.player.trail.clear(); self.ai_car.trail.clear()
+        self._acc = 0.0
+        self._snap_prev()
+
+    def _snap_prev(self):
+        self._prev = ((self.player.x, self.player.y), (self.ai_car.x, self.ai_car.y),
+                      (self.ball.x, self.ball.y))
+
+    def _noise(self):
+        """Next pre-drawn uniform(-1, 1) sample, refilling the batch when spent."""
+        i = self._noise_i
+        if i == self.NOISE_BATCH:
+            self._noise_buf = self._rng.uniform(-1.0, 1.0, self.NOISE_BATCH).tolist()
+            i = 0
+        self._noise_i = i + 1
+        return self._noise_buf[i]
 
     def show_msg(self, category: str):
         self.msg = ai_say(category)
         self.msg_timer = 3.0
 
     def handle_events(self):
-        for event in pygame.event.get():
+        for event in pygame.event.get(_HANDLED_EVENTS):
             if event.type == pygame.QUIT:
                 pygame.quit(); sys.exit()
             if event.type == pygame.KEYDOWN:
+                self._dirty = True
                 if self.state == "select":
-                    if event.key in (pygame.K_LEFT, pygame.K_a):
-                        self.sel_level = (self.sel_level - 1) % len(LEVELS)
-                    elif event.key in (pygame.K_RIGHT, pygame.K_d):
-                        self.sel_level = (self.sel_level + 1) % len(LEVELS)
-                    elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
+                    if event.key in _SEL_LEFT_KEYS:
+                        self.sel_level = (self.sel_level - 1) % N_LEVELS
+                    elif event.key in _SEL_RIGHT_KEYS:
+                        self.sel_level = (self.sel_level + 1) % N_LEVELS
+                    elif event.key in _SEL_GO_KEYS:
                         self._init_game(self.sel_level)
                         self.state = "playing"
-                    elif event.key == pygame.K_ESCAPE:
+                    elif event.key == _K_ESCAPE:
                         pygame.quit(); sys.exit()
 
                 elif self.state == "playing":
-                    if event.key == pygame.K_ESCAPE:
+                    if event.key == _K_ESCAPE:
                         self.state = "select"
-                    elif event.key == pygame.K_n:
-                        self.sel_level = (self.sel_level+1)%len(LEVELS)
+                    elif event.key == _K_N:
+                        self.sel_level = (self.sel_level+1)%N_LEVELS
                         self._init_game(self.sel_level); self.state="playing"
-                    elif event.key == pygame.K_r:
+                    elif event.key == _K_R:
                         self._init_game(self.level_id); self.state="playing"
 
                 elif self.state == "goal_flash":
-                    if event.key == pygame.K_SPACE:
+                    if event.key == _K_SPACE:
                         self.state = "playing"
                         self.reset_positions()
 
                 elif self.state == "gameover":
-                    if event.key == pygame.K_r:
+                    if event.key == _K_R:
                         self._init_game(self.level_id); self.state="playing"
-                    elif event.key == pygame.K_n:
-                        self.sel_level=(self.sel_level+1)%len(LEVELS)
+                    elif event.key == _K_N:
+                        self.sel_level=(self.sel_level+1)%N_LEVELS
                         self._init_game(self.sel_level); self.state="playing"
-                    elif event.key == pygame.K_ESCAPE:
+                    elif event.key == _K_ESCAPE:
                         self.state = "select"
 
+    def _apply_gravity(self, dt):
+        objs = (self.player, self.ai_car, self.ball)
+        pos, vel = self._grav_pos, self._grav_vel
+        for k, o in enumerate(objs):
+            pos[k] = o.x, o.y
+            vel[k] = o.vx, o.vy
+        self.level_map.apply_gravity_batch(pos, vel, self._grav_mass, dt)
+        for o, (vx, vy) in zip(objs, vel.tolist()):
+            o.vx, o.vy = vx, vy
+
     def update(self, dt):
         self.t += dt
-        self.msg_timer = max(0, self.msg_timer - dt)
+        if self.msg_timer > 0:
+            self.msg_timer = max(0, self.msg_timer - dt)
+            self._dirty = True   # the HUD message is still fading out
         if self.flash_timer > 0: self.flash_timer -= dt
 
         if self.state != "playing": return
 
+        # Physics runs in whole PHYS_DT steps; the remainder carries over
+        # and is used by draw() to interpolate between the last two steps
+        self._acc += dt
+        while self._acc >= PHYS_DT and self.state == "playing":
+            self._snap_prev()
+            self._physics_step(PHYS_DT)
+            self._acc -= PHYS_DT
+        if self.state != "playing":
+            # A goal or full time ended the step: freeze on the final positions
+            self._acc = 0.0
+            self._snap_prev()
+
+    def _physics_step(self, dt):
         # Controls
-        keys = pygame.key.get_pressed()
-        left    = keys[pygame.K_a] or keys[pygame.K_LEFT]
-        right   = keys[pygame.K_d] or keys[pygame.K_RIGHT]
-        forward = keys[pygame.K_w] or keys[pygame.K_UP]
-        back    = keys[pygame.K_s] or keys[pygame.K_DOWN]
-        boost   = keys[pygame.K_SPACE] or keys[pygame.K_LSHIFT]
+        K = self._K; k = pygame.key.get_pressed()
+        left    = k[K[0]] or k[K[1]]
+        right   = k[K[2]] or k[K[3]]
+        forward = k[K[4]] or k[K[5]]
+        back    = k[K[6]] or k[K[7]]
+        boost   = k[K[8]] or k[K[9]]
         self.player.apply_input(left,right,forward,back,boost,dt)
-        self.player.update(dt, self.level_map)
 
         # AI
         ai_l,ai_r,ai_f,ai_b,ai_boost = self.ai_brain.get_controls(
             self.ai_car, self.ball, self.level_map, dt)
         self.ai_state = self.ai_brain.state
         self.ai_car.apply_input(ai_l,ai_r,ai_f,ai_b,ai_boost,dt)
+
+        # Gravity for everything that moves, then integrate
+        self._apply_gravity(dt)
+        self.player.update(dt, self.level_map)
         self.ai_car.update(dt, self.level_map)
 
         # Ball
         self.ball.update(dt, self.level_map)
-        self.ball.car_hit(self.player, self.particles)
-        self.ball.car_hit(self.ai_car, self.particles)
+        self.ball.car_hits(self._cars, self.particles)
 
         # Boost pad picked up message
-        for pad in self.level_map.boost_pads:
-            if not pad.active and pad.cooldown > 4.9:
-                if self.msg_timer <= 0: self.show_msg("boost")
+        if self.level_map.pad_events:
+            if self.msg_timer <= 0: self.show_msg("boost")
+            self.level_map.pad_events.clear()
 
         # Hazard check
         if self.level_map.check_hazard_hit(self.player.x, self.player.y, max(CAR_W,CAR_H)//2):
-            self.player.vx += random.uniform(-120,120)
-            self.player.vy += random.uniform(-120,120)
+            self.player.vx += 120 * self._noise()
+            self.player.vy += 120 * self._noise()
             if self.msg_timer <= 0: self.show_msg("hazard")
 
         if self.player.boosting:
-            self.particles.emit(self.player.x,self.player.y,0,0,
-                                self.level_map.cfg["accent"],count=1,spread=5,life=0.2,size=3)
-
-        # Goals
-        if self.goal_l.check_goal(self.ball):
+            self.particles.queue(self.player.x,self.player.y,0,0,
+                                 self.level_map.cfg["accent"],count=1,spread=5,life=0.2,size=3)
+
+        # Goals: the ball's centre pixel against both goal mouths in one call
+        pt = self._ball_pt
+        pt.topleft = (int(self.ball.x), int(self.ball.y))
+        scored = pt.collidelist(self._goal_rects)
+        if scored == 0:
             self.ai_car.score += 1
             self.combo = 1
             self.ai_brain.goals_scored += 1; self.ai_brain.adapt()
             self._goal_event(self.level_map.cfg["accent2"], "goal_ai")
-        elif self.goal_r.check_goal(self.ball):
+        elif scored == 1:
             self.player.score += 1
             self.combo = min(self.combo+1, 8)
             self.ai_brain.goals_conceded += 1; self.ai_brain.adapt()
@@ -1547,6 +1982,8 @@ class Game:
             elif self.ai_car.score > self.player.score: self.winner="ai";     self.show_msg("defeat")
             else:                                        self.winner="draw";   self.show_msg("draw")
             self.state = "gameover"
+            self._build_gameover()
+            self._dirty = True
 
         self.level_map.update(dt)
         self.particles.update(dt)
@@ -1554,11 +1991,11 @@ class Game:
     def _goal_event(self, col, msg_cat):
         self.flash_col = col
         self.flash_timer = 1.2
+        self._flash_surf.fill(col)
         self.state = "goal_flash"
         self.show_msg(msg_cat)
-        for _ in range(50):
-            self.particles.emit(self.ball.x, self.ball.y, 0, 0, col,
-                                count=3, spread=200, life=1.5, size=random.randint(3,8))
+        self.particles.emit_batch(self.ball.x, self.ball.y, col, 150, spread=200,
+                                  life_range=(1.5, 1.5), size_range=(3, 8))
 
     def draw(self):
         if self.state == "select":
@@ -1566,50 +2003,50 @@ class Game:
             return
 
         cfg = self.level_map.cfg
-        self.screen.fill(cfg["bg"])
-        self.level_map.draw(self.screen, self.t)
+        screen = self.screen; blit = screen.blit
+        blit(self._bg_cache, (0, 0))
+        self.level_map.draw_dynamic(screen, self.t)
 
         # Field center line + circle
-        accent = cfg["accent"]
-        cx = SCREEN_W//2
-        field_s = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-        pygame.draw.line(field_s, (*accent, 40), (cx, 62), (cx, SCREEN_H), 1)
-        pygame.draw.circle(field_s, (*accent, 30), (cx, SCREEN_H//2), 90, 1)
-        pygame.draw.circle(field_s, (*accent, 50), (cx, SCREEN_H//2), 5)
-        self.screen.blit(field_s, (0,0))
-
-        self.goal_l.draw(self.screen, self.t)
-        self.goal_r.draw(self.screen, self.t)
-        self.particles.draw(self.screen)
-        self.ball.draw(self.screen, cfg)
-        self.player.draw(self.screen, self.particles)
-        self.ai_car.draw(self.screen, self.particles)
-
-        draw_hud(self.screen, self.fonts, self.player, self.ai_car,
+        blit(self._field_overlay, (0,0))
+
+        self.goal_l.draw(screen, self.t)
+        self.goal_r.draw(screen, self.t)
+        self.particles.draw(screen)
+        # Bodies are drawn at their interpolated positions, then restored
+        alpha = min(1.0, self._acc / PHYS_DT)
+        bodies = (self.player, self.ai_car, self.ball)
+        cur = [(o.x, o.y) for o in bodies]
+        for o, (px, py), (cx, cy) in zip(bodies, self._prev, cur):
+            o.x = px + (cx - px) * alpha; o.y = py + (cy - py) * alpha
+        self.ball.draw(screen, cfg)
+        self.player.draw(screen, self.particles)
+        self.ai_car.draw(screen, self.particles)
+        for o, (cx, cy) in zip(bodies, cur):
+            o.x = cx; o.y = cy
+
+        draw_hud(screen, self.fonts, self.player, self.ai_car,
                  self.level_map, self.time_left, self.ai_state,
                  self.particles, self.msg, self.msg_timer, self.combo)
 
         # Goal flash overlay
         if self.state == "goal_flash" and self.flash_timer > 0:
-            ov = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-            ov.fill((*self.flash_col, int(min(100, self.flash_timer * 80))))
-            self.screen.blit(ov, (0,0))
-            gt = self.fonts[1].render("GOAL!  PRESS SPACE", True, (255,255,255))
-            self.screen.blit(gt, (SCREEN_W//2-gt.get_width()//2, SCREEN_H//2-20))
+            alpha = int(min(100, self.flash_timer * 80))
+            if alpha >= 4:   # fainter tints are invisible; skip the full-screen blit
+                self._flash_surf.set_alpha(alpha)
+                blit(self._flash_surf, (0,0))
+            blit(*self._goal_text)
 
         # Gameover
         if self.state == "gameover":
             self._draw_gameover()
 
-        pygame.display.flip()
-
-    def _draw_gameover(self):
-        ov = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
+    def _build_gameover(self):
+        """Render the end-of-match panel once, as (surface, pos) blit pairs."""
+        ov = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA).convert_alpha()
         ov.fill((*self.level_map.cfg["bg"], 210))
-        self.screen.blit(ov, (0,0))
         font_big, font_med, font_sm, font_xs = self.fonts
         cfg = self.level_map.cfg
-        cx = SCREEN_W//2
 
         if   self.winner == "player": msg,col = "MISSION COMPLETE",   cfg["accent"]
         elif self.winner == "ai":     msg,col = "MISSION FAILED",      cfg["accent2"]
@@ -1623,28 +2060,46 @@ class Game:
             True, (60,80,120))
         map_info = font_xs.render(
             f"Arena: {cfg['name']}  |  Anomalies: {len(self.level_map.anomalies)}  |  "
-            f"Asteroids: {len(self.level_map.asteroids)}  |  Hazards: {', '.join(cfg['hazards']) or 'none'}",
+            f"Asteroids: {len(self.level_map.ast_x)}  |  Hazards: {', '.join(cfg['hazards']) or 'none'}",
             True, (50,60,90))
         best = font_xs.render(f"Total goals this match: {self.player.score + self.ai_car.score}", True, (150,140,0))
 
-        self.screen.blit(t1,      (cx - t1.get_width()//2,      SCREEN_H//2-130))
-        self.screen.blit(t2,      (cx - t2.get_width()//2,      SCREEN_H//2-68))
-        self.screen.blit(t3,      (cx - t3.get_width()//2,      SCREEN_H//2+10))
-        self.screen.blit(ai_info, (cx - ai_info.get_width()//2, SCREEN_H//2+50))
-        self.screen.blit(map_info,(cx - map_info.get_width()//2, SCREEN_H//2+80))
-        self.screen.blit(best,    (cx - best.get_width()//2,    SCREEN_H//2+108))
+        self._gameover_col = col
+        self._gameover_msg = (None, None, None)   # (text, surface, pos) of the last msg line
+        self._gameover_cache = [
+            (ov,                       (0, 0)),
+            (t1.convert_alpha(),       (CX - t1.get_width()//2,       CY-130)),
+            (t2.convert_alpha(),       (CX - t2.get_width()//2,       CY-68)),
+            (t3.convert_alpha(),       (CX - t3.get_width()//2,       CY+10)),
+            (ai_info.convert_alpha(),  (CX - ai_info.get_width()//2,  CY+50)),
+            (map_info.convert_alpha(), (CX - map_info.get_width()//2, CY+80)),
+            (best.convert_alpha(),     (CX - best.get_width()//2,     CY+108)),
+        ]
 
+    def _draw_gameover(self):
+        self.screen.blits(self._gameover_cache, doreturn=False)
         if self.msg:
-            msg_t = font_sm.render(self.msg, True, col)
-            self.screen.blit(msg_t, (cx - msg_t.get_width()//2, SCREEN_H//2+148))
+            # The AI's sign-off only changes when a new message is posted
+            if self._gameover_msg[0] != self.msg:
+                msg_t = render_text(self.fonts[2], self.msg, self._gameover_col)
+                self._gameover_msg = (self.msg, msg_t, (CX - msg_t.get_width()//2, CY+148))
+            self.screen.blit(*self._gameover_msg[1:])
 
     def run(self):
         while True:
-            dt = self.clock.tick(FPS) / 1000.0
+            dt = self.clock.tick(FPS if self.state == "playing" else MENU_FPS) / 1000.0
             dt = min(dt, 0.05)
-            self.handle_events()
+            now = pygame.time.get_ticks()
+            if now - self._last_event_pump >= EVENT_PERIOD_MS:
+                self._last_event_pump = now
+                self.handle_events()
             self.update(dt)
-            self.draw()
+            # The gameover panel is static once the HUD message has faded:
+            # from then on the last frame is just presented again
+            if self._dirty or self.state != "gameover":
+                self.draw()
+                self._dirty = False
+            pygame.display.flip()
 
 
 # ─── ENTRY POINT ──────────────────────────────────────────────────────────────